@@ -17,7 +17,7 @@ class AdjustmentLayer(Layer):
     def render_effect(self, source_image: QImage) -> QImage:
         """
         Apply the effect to the source image.
-        Returns a new QImage.
+        Returns a new QImage, or `source_image` itself when nothing changes.
         """
         if not self.visible:
             return source_image
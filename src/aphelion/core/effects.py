@@ -13,6 +13,9 @@ class Effect(ABC):
         Apply the effect to the image and return a new QImage.
         This must be a pure function if possible, or at least not modify the input image in place
         unless explicitly intended (but returning a copy is safer for Undo).
+        When the config makes the effect a no-op, the input image itself is
+        returned rather than a copy, so callers must not assume the result is
+        a distinct object.
         """
         pass
 
@@ -35,11 +38,16 @@ class EffectRegistry:
         return cls._instance
 
     @classmethod
-    def register(cls, effect_class: Type[Effect]):
+    def register(cls, effect_class: Type[Effect]) -> Type[Effect]:
+        # Idempotent: registering the same class again (e.g. a second
+        # register_all_effects() call) must not duplicate menu entries.
+        # Returns the class so plugins can also use it as a decorator.
         cat = effect_class.category
         if cat not in cls._effects:
             cls._effects[cat] = []
-        cls._effects[cat].append(effect_class)
+        if effect_class not in cls._effects[cat]:
+            cls._effects[cat].append(effect_class)
+        return effect_class
 
     @classmethod
     def get_all(cls) -> Dict[str, list[Type[Effect]]]:
@@ -393,6 +393,9 @@ class CairoRenderer:
             
             # Apply effect
             result_img = layer.render_effect(temp_img)
+            if result_img is temp_img:
+                # No-op settings hand the input back: the surface already holds it
+                return
             
             # Convert back and write to surface
             result_arr = np.frombuffer(
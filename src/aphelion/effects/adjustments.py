@@ -3,12 +3,92 @@ Adjustment effects for Aphelion.
 
 Optimized with NumPy for high-performance LUT-based transformations.
 """
-from PySide6.QtGui import QImage, QColor, qRgb
+from PySide6.QtGui import QImage, QColor, QPixmap, qRgb
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QDialogButtonBox, QWidget
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal, QTimer
 from ..core.effects import Effect
-from ..utils.image_processing import qimage_to_numpy, numpy_to_qimage, apply_lut
+from ..utils.image_processing import (
+    qimage_view, apply_channel_luts,
+    get_scratch, release_scratch, to_planes, parallel_rows
+)
 import numpy as np
+from functools import lru_cache
+
+__all__ = [
+    "InvertEffect", "InvertAlphaEffect", "BrightnessContrastEffect",
+    "HueSaturationEffect", "AutoLevelEffect", "ColorBalanceEffect",
+]
+
+try:
+    import cv2
+except ImportError:  # OpenCV is an optional accelerator
+    cv2 = None
+
+
+@lru_cache(maxsize=256)
+def _brightness_contrast_lut(brightness: int, contrast: int) -> np.ndarray:
+    """Build the Brightness/Contrast LUT. Memoized, so the result is read-only."""
+    c = contrast
+    if c == 100:
+        c = 99  # Avoid div by zero
+    factor = (259 * (c + 255)) / (255 * (259 - c))
+    
+    indices = np.arange(256, dtype=np.float32)
+    lut = (indices - 128) * factor + 128 + brightness
+    lut = np.clip(lut, 0, 255).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=256)
+def _stretch_lut(cmin: int, cmax: int) -> np.ndarray:
+    """Build a LUT mapping [cmin, cmax] onto [0, 255]. Memoized, so the result is read-only."""
+    lut = np.arange(256, dtype=np.float32)
+    lut = (lut - cmin) * 255 / (cmax - cmin)
+    lut = np.clip(lut, 0, 255).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=256)
+def _offset_lut(offset: int) -> np.ndarray:
+    """Build a saturating-add LUT for one channel. Memoized, so the result is read-only."""
+    lut = np.clip(np.arange(256, dtype=np.int16) + offset, 0, 255).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+# For each HSV->RGB hue segment 0-5, which of (0, C, X) lands in B, G and R.
+_HSV_SEGMENT_TABLE = np.array([
+    [0, 2, 1],  # 0: r=c, g=x, b=0
+    [0, 1, 2],  # 1: r=x, g=c, b=0
+    [2, 1, 0],  # 2: r=0, g=c, b=x
+    [1, 2, 0],  # 3: r=0, g=x, b=c
+    [1, 0, 2],  # 4: r=x, g=0, b=c
+    [2, 0, 1],  # 5: r=c, g=0, b=x
+], dtype=np.uint8)
+
+
+def _new_image(image: QImage) -> tuple:
+    """
+    Allocate the output QImage for `image` and a writable view of its pixels.
+    
+    Effects read the input through qimage_view() and write straight into this
+    view, so neither side of the conversion copies the pixel buffer.
+    """
+    result = QImage(image.width(), image.height(), QImage.Format.Format_ARGB32_Premultiplied)
+    return result, qimage_view(result, writable=True)
+
+
+def _xor_pixels(arr: np.ndarray, out: np.ndarray, mask: int):
+    """
+    XOR every BGRA pixel with a 32-bit mask in one contiguous pass.
+    
+    Pixels are read as little-endian uint32, so B is the low byte and A the
+    high byte: 0x00FFFFFF inverts B, G and R, 0xFF000000 inverts alpha.
+    x ^ 0xFF == 255 - x for uint8, without strided per-channel writes.
+    """
+    np.bitwise_xor(arr.view('<u4'), np.uint32(mask), out=out.view('<u4'))
 
 
 class InvertEffect(Effect):
@@ -16,14 +96,66 @@ class InvertEffect(Effect):
     category = "Adjustments"
 
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         # Invert RGB channels (indices 0, 1, 2), preserve alpha (index 3)
-        result = arr.copy()
-        result[:, :, :3] = 255 - arr[:, :, :3]
-        return numpy_to_qimage(result)
+        new_img, result = _new_image(image)
+        _xor_pixels(arr, result, 0x00FFFFFF)
+        return new_img
+
 
+# Longest side of the proxy image adjustment dialogs preview on. Sliders
+# re-run the effect as they move, so previews stay far below full size; the
+# full-resolution pass only runs once the dialog is accepted.
+_PREVIEW_MAX_DIM = 384
 
-class BrightnessContrastDialog(QDialog):
+# Quiet period after the last slider tick before the preview re-renders, so a
+# drag renders once it pauses instead of once per intermediate value
+_PREVIEW_DEBOUNCE_MS = 50
+
+
+class _PreviewDialog(QDialog):
+    """Adjustment dialog that can show the effect live on a downscaled proxy."""
+    preview_changed = Signal(QImage)
+    
+    def set_preview_source(self, image: QImage, effect: Effect):
+        """Preview `effect` on a scaled-down copy of `image` as the sliders move."""
+        if max(image.width(), image.height()) > _PREVIEW_MAX_DIM:
+            image = image.scaled(_PREVIEW_MAX_DIM, _PREVIEW_MAX_DIM,
+                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        first = getattr(self, "_preview_source", None) is None
+        self._preview_source = image
+        self._preview_effect = effect
+        
+        if first:
+            self.preview_label = QLabel()
+            self.preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.layout().insertWidget(0, self.preview_label)
+            self._preview_timer = QTimer(self)
+            self._preview_timer.setSingleShot(True)
+            self._preview_timer.setInterval(_PREVIEW_DEBOUNCE_MS)
+            self._preview_timer.timeout.connect(self.update_preview)
+            for slider in self.findChildren(QSlider):
+                slider.valueChanged.connect(self.schedule_preview)
+        self.update_preview()
+    
+    def schedule_preview(self, *_):
+        """Re-render the preview once the sliders have been still for a moment."""
+        self._preview_timer.start()
+    
+    def done(self, result: int):
+        # A preview still waiting out the debounce is moot once the dialog closes
+        if getattr(self, "_preview_timer", None) is not None:
+            self._preview_timer.stop()
+        super().done(result)
+    
+    def update_preview(self):
+        preview = self._preview_effect.apply(self._preview_source, self.get_config())
+        self.preview_label.setPixmap(QPixmap.fromImage(preview))
+        self.preview_changed.emit(preview)
+
+
+class BrightnessContrastDialog(_PreviewDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Brightness / Contrast")
@@ -80,25 +212,18 @@ class BrightnessContrastEffect(Effect):
         contrast = config.get("contrast", 0)
         
         if brightness == 0 and contrast == 0:
-            return image.copy()
-        
-        # Build LUT using NumPy (vectorized)
-        c = contrast
-        if c == 100:
-            c = 99  # Avoid div by zero
-        factor = (259 * (c + 255)) / (255 * (259 - c))
+            return image
         
-        indices = np.arange(256, dtype=np.float32)
-        lut = (indices - 128) * factor + 128 + brightness
-        lut = np.clip(lut, 0, 255).astype(np.uint8)
+        lut = _brightness_contrast_lut(brightness, contrast)
         
         # Apply LUT
-        arr = qimage_to_numpy(image)
-        result = apply_lut(arr, lut, channels=(0, 1, 2))
-        return numpy_to_qimage(result)
+        arr = qimage_view(image)
+        new_img, result = _new_image(image)
+        apply_channel_luts(arr, {0: lut, 1: lut, 2: lut}, out=result)
+        return new_img
 
 
-class HueSaturationDialog(QDialog):
+class HueSaturationDialog(_PreviewDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Hue / Saturation")
@@ -153,29 +278,51 @@ class HueSaturationEffect(Effect):
         sat_shift = config.get("saturation", 0)
         
         if hue_shift == 0 and sat_shift == 0:
-            return image.copy()
+            return image
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
+        new_img, result = _new_image(image)
         
-        # Convert BGRA to RGB for HSV conversion
-        b, g, r, a = arr[:, :, 0], arr[:, :, 1], arr[:, :, 2], arr[:, :, 3]
+        if cv2 is not None:
+            self._apply_cv2(arr, result, hue_shift, sat_shift)
+            return new_img
         
-        # RGB to HSV conversion (vectorized)
-        rgb = np.stack([r, g, b], axis=-1).astype(np.float32) / 255.0
+        # Planar B, G, R scratch for the whole image, so the pool sees one
+        # buffer of one shape however the rows are banded
+        bgr = get_scratch((3,) + arr.shape[:2], np.float32)
         
-        cmax = rgb.max(axis=-1)
-        cmin = rgb.min(axis=-1)
+        # Bands are independent per-pixel work, so they run concurrently
+        parallel_rows(lambda start, stop: self._apply_np(
+            arr[start:stop], result[start:stop], bgr[:, start:stop], hue_shift, sat_shift),
+            arr.shape[0])
+        release_scratch(bgr)
+        return new_img
+    
+    @staticmethod
+    def _apply_np(arr: np.ndarray, result: np.ndarray, bgr: np.ndarray,
+                  hue_shift: int, sat_shift: int):
+        """HSV round-trip of `arr` into `result` in NumPy, using the (3, H, W) float32 `bgr` as scratch."""
+        # RGB to HSV conversion (vectorized) on planar B, G, R copies, so every
+        # channel read below is a unit-stride pass instead of a 4-byte stride
+        np.divide(arr[:, :, :3].transpose(2, 0, 1), np.float32(255.0), out=bgr)
+        b, g, r = bgr
+        
+        cmax = np.maximum(np.maximum(b, g), r)
+        cmin = np.minimum(np.minimum(b, g), r)
         delta = cmax - cmin
         
-        # Hue calculation
-        h = np.zeros_like(cmax)
-        mask_r = (cmax == rgb[:, :, 0]) & (delta > 0)
-        mask_g = (cmax == rgb[:, :, 1]) & (delta > 0) & ~mask_r
-        mask_b = (cmax == rgb[:, :, 2]) & (delta > 0) & ~mask_r & ~mask_g
-        
-        h[mask_r] = 60 * (((rgb[:, :, 1] - rgb[:, :, 2]) / np.maximum(delta, 1e-10)) % 6)[mask_r]
-        h[mask_g] = 60 * (((rgb[:, :, 2] - rgb[:, :, 0]) / np.maximum(delta, 1e-10)) + 2)[mask_g]
-        h[mask_b] = 60 * (((rgb[:, :, 0] - rgb[:, :, 1]) / np.maximum(delta, 1e-10)) + 4)[mask_b]
+        # Hue calculation: pick the numerator and sector offset for whichever
+        # channel is the max, then divide by delta once instead of per branch.
+        # The G and B sectors already land in [1, 3] and [3, 5], so the shared
+        # "% 6" only ever changes the R sector.
+        mask_r = cmax == r
+        mask_g = (cmax == g) & ~mask_r
+        h = np.where(mask_r, g - b, np.where(mask_g, b - r, r - g))
+        h /= np.maximum(delta, 1e-10)
+        h += np.where(mask_r, np.float32(0), np.where(mask_g, np.float32(2), np.float32(4)))
+        h %= 6
+        h *= 60
+        h[delta == 0] = 0  # Grays have no hue
         
         # Saturation calculation
         s = np.where(cmax > 0, delta / np.maximum(cmax, 1e-10), 0)
@@ -196,37 +343,53 @@ class HueSaturationEffect(Effect):
         x = c * (1 - np.abs((h / 60) % 2 - 1))
         m = v - c
         
-        h_segment = (h / 60).astype(np.int32) % 6
-        
-        r_out = np.zeros_like(h)
-        g_out = np.zeros_like(h)
-        b_out = np.zeros_like(h)
-        
-        # Segment 0: r=c, g=x, b=0
-        mask = h_segment == 0
-        r_out[mask], g_out[mask], b_out[mask] = c[mask], x[mask], 0
-        # Segment 1: r=x, g=c, b=0
-        mask = h_segment == 1
-        r_out[mask], g_out[mask], b_out[mask] = x[mask], c[mask], 0
-        # Segment 2: r=0, g=c, b=x
-        mask = h_segment == 2
-        r_out[mask], g_out[mask], b_out[mask] = 0, c[mask], x[mask]
-        # Segment 3: r=0, g=x, b=c
-        mask = h_segment == 3
-        r_out[mask], g_out[mask], b_out[mask] = 0, x[mask], c[mask]
-        # Segment 4: r=x, g=0, b=c
-        mask = h_segment == 4
-        r_out[mask], g_out[mask], b_out[mask] = x[mask], 0, c[mask]
-        # Segment 5: r=c, g=0, b=x
-        mask = h_segment == 5
-        r_out[mask], g_out[mask], b_out[mask] = c[mask], 0, x[mask]
-        
-        r_out = ((r_out + m) * 255).astype(np.uint8)
-        g_out = ((g_out + m) * 255).astype(np.uint8)
-        b_out = ((b_out + m) * 255).astype(np.uint8)
-        
-        result = np.stack([b_out, g_out, r_out, a], axis=-1)
-        return numpy_to_qimage(result)
+        # Segment indices fit in uint8; keeping the index arrays narrow cuts the
+        # gather's index traffic from 8 bytes per channel to 1
+        h_segment = (h / 60).astype(np.uint8)
+        h_segment %= 6
+        
+        # Pick each output plane from (0, c, x) using the hue segment as a row
+        # index into a 6x3 table, instead of one boolean mask pass per segment
+        zeros = np.zeros_like(c)
+        for k in range(3):
+            plane = np.choose(_HSV_SEGMENT_TABLE[:, k][h_segment], (zeros, c, x))
+            plane += m
+            plane *= 255
+            # Round like the OpenCV path; truncating would leave the NumPy
+            # fallback one level darker on a third of channels
+            np.rint(plane, out=plane)
+            result[:, :, k] = plane
+        result[:, :, 3] = arr[:, :, 3]
+    
+    @staticmethod
+    def _apply_cv2(arr: np.ndarray, result: np.ndarray, hue_shift: int, sat_shift: int):
+        """HSV round-trip of `arr` into `result` using OpenCV's SIMD color conversion."""
+        # float32 input keeps hue in exact degrees (0-360); the 8-bit HSV_FULL
+        # variant quantizes hue to ~1.4 degree steps and shifts colors visibly
+        bgr = get_scratch(arr.shape[:2] + (3,), np.float32)
+        np.divide(arr[:, :, :3], np.float32(255.0), out=bgr)
+        hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+        
+        if hue_shift:
+            h = hsv[:, :, 0]
+            h += hue_shift
+            np.mod(h, 360, out=h)
+        
+        if sat_shift:
+            s = hsv[:, :, 1]
+            if sat_shift > 0:
+                s += (1 - s) * (sat_shift / 100.0)
+            else:
+                s += s * (sat_shift / 100.0)
+            np.clip(s, 0, 1, out=s)
+        
+        cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR, dst=bgr)
+        # Scale, round and saturate to uint8 in one SIMD pass (rounding matters:
+        # cvtColor's float error would otherwise truncate 255 to 254), then
+        # interleave with the source alpha straight into the output view
+        bgr8 = cv2.convertScaleAbs(bgr, alpha=255.0)
+        cv2.mixChannels([bgr8, arr], [result], [0, 0, 1, 1, 2, 2, 6, 3])
+        release_scratch(bgr)
 
 
 class AutoLevelEffect(Effect):
@@ -234,24 +397,22 @@ class AutoLevelEffect(Effect):
     category = "Adjustments"
     
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
-        
-        # Find min/max for each channel
-        result = arr.copy()
+        arr = qimage_view(image)
         
-        for c in range(3):  # B, G, R channels
-            channel = arr[:, :, c]
-            cmin = channel.min()
-            cmax = channel.max()
-            
+        # Find min/max for each channel and stretch it to the full range
+        luts = {}
+        for c, plane in enumerate(to_planes(arr)):  # B, G, R
+            cmin, cmax = int(plane.min()), int(plane.max())
             if cmax > cmin:
-                # Build and apply LUT
-                lut = np.arange(256, dtype=np.float32)
-                lut = (lut - cmin) * 255 / (cmax - cmin)
-                lut = np.clip(lut, 0, 255).astype(np.uint8)
-                result[:, :, c] = lut[channel]
+                luts[c] = _stretch_lut(cmin, cmax)
         
-        return numpy_to_qimage(result)
+        if not luts:
+            return image
+        
+        # Apply all channel LUTs together in a single pass
+        new_img, result = _new_image(image)
+        apply_channel_luts(arr, luts, out=result)
+        return new_img
 
 
 class InvertAlphaEffect(Effect):
@@ -260,13 +421,13 @@ class InvertAlphaEffect(Effect):
     category = "Adjustments"
 
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
-        result = arr.copy()
-        result[:, :, 3] = 255 - arr[:, :, 3]  # Alpha channel is index 3
-        return numpy_to_qimage(result)
+        arr = qimage_view(image)
+        new_img, result = _new_image(image)
+        _xor_pixels(arr, result, 0xFF000000)  # Alpha channel is index 3
+        return new_img
 
 
-class ColorBalanceDialog(QDialog):
+class ColorBalanceDialog(_PreviewDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Color Balance")
@@ -339,18 +500,24 @@ class ColorBalanceEffect(Effect):
         yellow_blue = config.get("yellow_blue", 0)
         
         if cyan_red == 0 and magenta_green == 0 and yellow_blue == 0:
-            return image.copy()
-        
-        arr = qimage_to_numpy(image)
-        result = arr.astype(np.int16)  # Prevent overflow
+            return image
         
         # BGRA format: B=0, G=1, R=2
-        # Cyan-Red affects R channel
-        result[:, :, 2] += int(cyan_red * 2.55)
-        # Magenta-Green affects G channel
-        result[:, :, 1] += int(magenta_green * 2.55)
-        # Yellow-Blue affects B channel
-        result[:, :, 0] += int(yellow_blue * 2.55)
-        
-        result = np.clip(result, 0, 255).astype(np.uint8)
-        return numpy_to_qimage(result)
+        # Cyan-Red affects R, Magenta-Green affects G, Yellow-Blue affects B
+        offsets = {
+            2: int(cyan_red * 2.55),
+            1: int(magenta_green * 2.55),
+            0: int(yellow_blue * 2.55),
+        }
+        
+        # A saturating add is a per-channel LUT, so the whole adjustment is a
+        # single pass over uint8 data with no int16 promotion. Channels whose
+        # offset rounds to zero get no table and are copied through untouched.
+        luts = {c: _offset_lut(off) for c, off in offsets.items() if off}
+        if not luts:
+            return image
+        
+        arr = qimage_view(image)
+        new_img, result = _new_image(image)
+        apply_channel_luts(arr, luts, out=result)
+        return new_img
@@ -3,15 +3,39 @@ Distortion and stylize effects for Aphelion.
 
 Optimized with NumPy for high-performance coordinate mapping.
 """
-from PySide6.QtGui import QImage, QColor
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QDialogButtonBox, QSpinBox
+from PySide6.QtGui import QImage, QColor, QPainter, QTransform
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QDialogButtonBox, QSpinBox, QCheckBox
 from PySide6.QtCore import Qt
 from ..core.effects import Effect
-from ..utils.image_processing import qimage_to_numpy, numpy_to_qimage
+from ..utils.image_processing import (
+    qimage_view, sobel_magnitude, median_blur_np, gather_pixels,
+    remap_bilinear, parallel_rows
+)
 import numpy as np
 import math
 import random
 
+try:
+    import cv2
+except ImportError:  # OpenCV is an optional accelerator
+    cv2 = None
+
+
+# Target size of one int16 noise strip in Add Noise: generated, added and
+# clipped while it is still in cache instead of as one full-size buffer
+_NOISE_STRIP_BYTES = 1 << 20
+
+# Target size of one 4-byte-per-pixel sample map (float32 coordinates or
+# int32 indices) in the warps and multi-sample blurs. Row strips this small
+# keep a kernel's maps, temporaries and accumulator in cache from one
+# ufunc to the next instead of streaming full-size arrays through memory
+_SAMPLE_STRIP_BYTES = 256 << 10
+
+
+def _sample_strip_rows(width: int) -> int:
+    """Rows in one _SAMPLE_STRIP_BYTES strip of an image `width` pixels wide."""
+    return max(_SAMPLE_STRIP_BYTES // (width * 4), 1)
+
 
 class PixelateDialog(QDialog):
     def __init__(self, parent=None):
@@ -50,22 +74,48 @@ class PixelateEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         cell_size = config.get("cell_size", 8)
         
-        arr = qimage_to_numpy(image)
-        height, width = arr.shape[:2]
-        
-        # Downsample then upsample for pixelation effect
-        small_h = max(1, height // cell_size)
-        small_w = max(1, width // cell_size)
+        # One-pixel cells are the image itself
+        if cell_size <= 1:
+            return image
         
-        # Average each cell
-        result = arr.copy()
-        for cy in range(0, height, cell_size):
-            for cx in range(0, width, cell_size):
-                cell = arr[cy:min(cy+cell_size, height), cx:min(cx+cell_size, width)]
-                avg_color = cell.mean(axis=(0, 1)).astype(np.uint8)
-                result[cy:min(cy+cell_size, height), cx:min(cx+cell_size, width)] = avg_color
+        arr = qimage_view(image)
+        height, width = arr.shape[:2]
         
-        return numpy_to_qimage(result)
+        # Cells start every cell_size pixels; the last row and column of
+        # cells are cut short when the size does not divide the image
+        ys = np.arange(0, height, cell_size)
+        xs = np.arange(0, width, cell_size)
+        cell_h = np.diff(ys, append=height)
+        cell_w = np.diff(xs, append=width)
+        
+        # Sum every cell, ragged edges included. Rows go first: row dy of
+        # every band of cells is the strided slice arr[dy::cell_size], so
+        # the full-size pass is a few whole-row adds (reduceat over many
+        # short segments is several times slower). A run of up to 257
+        # bytes fits uint16, which keeps that pass narrow
+        narrow = np.uint16 if cell_size <= 257 else np.uint32
+        sums = arr[::cell_size].astype(narrow)
+        for dy in range(1, min(cell_size, height)):
+            rows = arr[dy::cell_size]
+            sums[:len(rows)] += rows
+        
+        # The columns then reduce an array cell_size times smaller
+        sums = np.add.reduceat(sums, xs, axis=1, dtype=np.uint32)
+        
+        # Integer floor division is exactly the truncated mean
+        sums //= (cell_h[:, None] * cell_w[None, :])[:, :, None].astype(np.uint32)
+        cells = sums.astype(np.uint8)
+        
+        # Expand each cell's mean back over the pixels it covers, straight
+        # into the output image: widen the small grid once, then row dy of
+        # every band is again one strided whole-row store
+        band = np.repeat(cells, cell_w, axis=1)
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        for dy in range(min(cell_size, height)):
+            rows = result[dy::cell_size]
+            rows[:] = band[:len(rows)]
+        return new_img
 
 
 class EmbossEffect(Effect):
@@ -74,27 +124,59 @@ class EmbossEffect(Effect):
     category = "Stylize"
     
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         
         # Emboss kernel
-        kernel = np.array([[-2, -1, 0], [-1, 1, 1], [0, 1, 2]], dtype=np.float32)
-        
-        result = arr.copy().astype(np.float32)
+        kernel = np.array([[-2, -1, 0], [-1, 1, 1], [0, 1, 2]], dtype=np.int16)
+        height, width = arr.shape[:2]
         
-        # Apply convolution to RGB channels
-        for c in range(3):
-            channel = arr[:, :, c].astype(np.float32)
-            padded = np.pad(channel, 1, mode='edge')
-            
-            conv_result = np.zeros_like(channel)
-            for ky in range(3):
-                for kx in range(3):
-                    conv_result += padded[ky:ky+channel.shape[0], kx:kx+channel.shape[1]] * kernel[ky, kx]
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        
+        if cv2 is not None:
+            # One SIMD pass over all four channels: filter2D correlates like
+            # the slices below, delta adds the 128 bias, the uint8 store
+            # saturates like the clip, and BORDER_REPLICATE repeats the edge.
+            # The integer sums are exact in its float accumulator
+            cv2.filter2D(arr, -1, kernel.astype(np.float32), dst=result,
+                         delta=128, borderType=cv2.BORDER_REPLICATE)
+            result[:, :, 3] = arr[:, :, 3]
+            return new_img
+        
+        result[:, :, 3] = arr[:, :, 3]
+        
+        def emboss(start, stop):
+            # One row of context either side, repeating the edge rows at the
+            # image border, keeps the stencil exact at band seams
+            rows = np.clip(np.arange(start - 1, stop + 1), 0, height - 1)
             
-            result[:, :, c] = conv_result + 128
-        
-        result = np.clip(result, 0, 255).astype(np.uint8)
-        return numpy_to_qimage(result)
+            # Integer weights on 8-bit samples: every sum fits int16 exactly, so
+            # the shifted-slice accumulation needs no float conversion at all
+            acc = np.empty((stop - start, width), dtype=np.int16)
+            padded = np.empty((stop - start + 2, width + 2), dtype=np.int16)
+            for c in range(3):
+                # Widen into a reused buffer and repeat the edge columns by hand
+                padded[:, 1:-1] = arr[rows, :, c]
+                padded[:, 0] = padded[:, 1]
+                padded[:, -1] = padded[:, -2]
+                acc.fill(128)
+                for ky in range(3):
+                    for kx in range(3):
+                        weight = int(kernel[ky, kx])
+                        shifted = padded[ky:ky + stop - start, kx:kx + width]
+                        # Unit weights add or subtract in place; only ±2 needs a product
+                        if weight == 1:
+                            acc += shifted
+                        elif weight == -1:
+                            acc -= shifted
+                        elif weight:
+                            acc += weight * shifted
+                
+                np.clip(acc, 0, 255, out=acc)
+                result[start:stop, :, c] = acc
+        
+        parallel_rows(emboss, height)
+        return new_img
 
 
 class EdgeDetectEffect(Effect):
@@ -103,38 +185,36 @@ class EdgeDetectEffect(Effect):
     category = "Stylize"
     
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
-        
-        # Convert to grayscale
-        gray = (arr[:, :, 0].astype(np.float32) + 
-                arr[:, :, 1].astype(np.float32) + 
-                arr[:, :, 2].astype(np.float32)) / 3
-        
-        # Sobel kernels
-        gx = np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]], dtype=np.float32)
-        gy = np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]], dtype=np.float32)
+        arr = qimage_view(image)
         
-        padded = np.pad(gray, 1, mode='edge')
-        
-        grad_x = np.zeros_like(gray)
-        grad_y = np.zeros_like(gray)
-        
-        for ky in range(3):
-            for kx in range(3):
-                shifted = padded[ky:ky+gray.shape[0], kx:kx+gray.shape[1]]
-                grad_x += shifted * gx[ky, kx]
-                grad_y += shifted * gy[ky, kx]
+        height, width = arr.shape[:2]
         
-        magnitude = np.sqrt(grad_x**2 + grad_y**2)
-        magnitude = np.clip(magnitude, 0, 255).astype(np.uint8)
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        result[:, :, 3] = arr[:, :, 3]
         
-        # Create grayscale output
-        result = arr.copy()
-        result[:, :, 0] = magnitude
-        result[:, :, 1] = magnitude
-        result[:, :, 2] = magnitude
+        def detect(start, stop):
+            # One row of context either side keeps the Sobel stencil exact at band seams
+            lo, hi = max(start - 1, 0), min(stop + 1, height)
+            
+            # Fixed-point Rec. 601 luma, (77 R + 150 G + 29 B) >> 8: the
+            # weights sum to 256, so the uint16 sums cannot overflow and
+            # the division is a shift (channels are BGR in memory)
+            gray = np.multiply(arr[lo:hi, :, 2], 77, dtype=np.uint16)
+            gray += np.multiply(arr[lo:hi, :, 1], 150, dtype=np.uint16)
+            gray += np.multiply(arr[lo:hi, :, 0], 29, dtype=np.uint16)
+            gray >>= 8
+            
+            # Sobel with the edge pixel repeated, through the shared separable
+            # kernels (OpenCV when available, shifted slices otherwise)
+            magnitude = sobel_magnitude(gray.astype(np.float32))[start - lo:stop - lo]
+            np.minimum(magnitude, 255, out=magnitude)
+            
+            # Grayscale output: one broadcast store fills all three channels
+            result[start:stop, :, :3] = magnitude[:, :, None]
         
-        return numpy_to_qimage(result)
+        parallel_rows(detect, height)
+        return new_img
 
 
 class AddNoiseDialog(QDialog):
@@ -177,17 +257,37 @@ class AddNoiseEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         intensity = config.get("intensity", 25)
         
-        arr = qimage_to_numpy(image)
-        height, width = arr.shape[:2]
-        
-        # Generate noise
-        noise = np.random.randint(-intensity, intensity + 1, (height, width, 3), dtype=np.int16)
+        if intensity <= 0:
+            return image
         
-        result = arr.astype(np.int16)
-        result[:, :, :3] += noise
-        result = np.clip(result, 0, 255).astype(np.uint8)
+        arr = qimage_view(image)
+        height, width = arr.shape[:2]
         
-        return numpy_to_qimage(result)
+        # Strips write straight into the output image; only alpha is copied
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        result[:, :, 3] = arr[:, :, 3]
+        
+        # One fresh seed per apply; each strip draws from its own PCG64
+        # stream keyed by its first row, so bands need no shared generator
+        entropy = np.random.SeedSequence().entropy
+        strip = max(_NOISE_STRIP_BYTES // (width * 3 * 2), 1)
+        
+        def add_noise(start, stop):
+            for y0 in range(start, stop, strip):
+                y1 = min(y0 + strip, stop)
+                
+                # Generate noise (PCG64 draws int16 directly, several times faster
+                # than the legacy global Mersenne Twister) and add the colour onto it
+                noise = np.random.default_rng([entropy, y0]).integers(
+                    -intensity, intensity + 1, (y1 - y0, width, 3), dtype=np.int16
+                )
+                noise += arr[y0:y1, :, :3]
+                np.clip(noise, 0, 255, out=noise)
+                result[y0:y1, :, :3] = noise
+        
+        parallel_rows(add_noise, height)
+        return new_img
 
 
 class ReduceNoiseEffect(Effect):
@@ -196,25 +296,12 @@ class ReduceNoiseEffect(Effect):
     category = "Noise"
     
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
-        height, width = arr.shape[:2]
-        result = arr.copy()
+        arr = qimage_view(image)
         
-        # 3x3 median filter
-        radius = 1
-        window_size = 3
-        
-        for c in range(3):
-            padded = np.pad(arr[:, :, c], radius, mode='edge')
-            neighborhoods = np.lib.stride_tricks.sliding_window_view(
-                padded, (window_size, window_size)
-            )
-            result[:, :, c] = np.median(
-                neighborhoods.reshape(height, width, -1), 
-                axis=2
-            ).astype(np.uint8)
-        
-        return numpy_to_qimage(result)
+        # 3x3 median filter, written straight into the output image
+        new_img = QImage(image.width(), image.height(), QImage.Format.Format_ARGB32_Premultiplied)
+        median_blur_np(arr, 1, out=qimage_view(new_img, writable=True))
+        return new_img
 
 
 class RadialBlurDialog(QDialog):
@@ -254,33 +341,50 @@ class RadialBlurEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         amount = config.get("amount", 10)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         cx, cy = width / 2, height / 2
         
-        # Create coordinate grids
-        y_coords, x_coords = np.mgrid[0:height, 0:width].astype(np.float32)
+        # The rotation is separable into a per-column and a per-row term,
+        # so each step needs only one full-size add per coordinate
+        dx = np.arange(width, dtype=np.float32) - cx
+        dy = np.arange(height, dtype=np.float32)[:, None] - cy
         
-        result = np.zeros_like(arr, dtype=np.float32)
+        # Integer sums are exact, and floor division equals the float mean's cast
+        wide = np.uint16 if amount <= 257 else np.uint32
         
-        for i in range(amount):
-            angle = (i / amount) * 0.05
-            cos_a, sin_a = np.cos(angle), np.sin(angle)
-            
-            dx = x_coords - cx
-            dy = y_coords - cy
+        # Every step's rotation, tabulated up front
+        angles = (np.arange(amount) / amount) * 0.05
+        cos_t, sin_t = np.cos(angles), np.sin(angles)
+        
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        
+        def blur(start, stop):
+            band_dy = dy[start:stop]
             
-            sx = (cx + dx * cos_a - dy * sin_a).astype(np.int32)
-            sy = (cy + dx * sin_a + dy * cos_a).astype(np.int32)
+            # The first step (angle 0) samples every pixel in place
+            acc = arr[start:stop].astype(wide)
             
-            sx = np.clip(sx, 0, width - 1)
-            sy = np.clip(sy, 0, height - 1)
+            for i in range(1, amount):
+                cos_a, sin_a = cos_t[i], sin_t[i]
+                
+                sx = ((cx + dx * cos_a) - band_dy * sin_a).astype(np.int32)
+                sy = ((cy + dx * sin_a) + band_dy * cos_a).astype(np.int32)
+                
+                np.clip(sx, 0, width - 1, out=sx)
+                np.clip(sy, 0, height - 1, out=sy)
+                
+                acc += gather_pixels(arr, sy, sx)
             
-            result += arr[sy, sx].astype(np.float32)
+            acc //= amount
+            result[start:stop] = acc
         
-        result = (result / amount).astype(np.uint8)
-        return numpy_to_qimage(result)
+        # Each strip runs all of its steps before moving on, instead of
+        # every step sweeping the whole image through memory
+        parallel_rows(blur, height, max_rows=_sample_strip_rows(width))
+        return new_img
 
 
 class ZoomBlurDialog(QDialog):
@@ -320,29 +424,42 @@ class ZoomBlurEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         amount = config.get("amount", 20)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         cx, cy = width / 2, height / 2
         samples = max(2, amount // 5)
         
-        y_coords, x_coords = np.mgrid[0:height, 0:width].astype(np.float32)
+        # Scaling about the centre moves columns and rows independently,
+        # so each step only maps one row and one column of coordinates
+        dx = np.arange(width, dtype=np.float32) - cx
+        dy = np.arange(height, dtype=np.float32) - cy
         
-        result = np.zeros_like(arr, dtype=np.float32)
-        
-        for i in range(samples):
+        # Every step's source columns and rows, tabulated up front
+        steps = []
+        for i in range(1, samples):
             scale = 1.0 - (i / samples) * (amount / 100.0)
             
-            sx = (cx + (x_coords - cx) * scale).astype(np.int32)
-            sy = (cy + (y_coords - cy) * scale).astype(np.int32)
-            
-            sx = np.clip(sx, 0, width - 1)
-            sy = np.clip(sy, 0, height - 1)
+            sx = np.clip((cx + dx * scale).astype(np.int32), 0, width - 1)
+            sy = np.clip((cy + dy * scale).astype(np.int32), 0, height - 1)
+            steps.append((sx, sy[:, None]))
+        
+        wide = np.uint16 if samples <= 257 else np.uint32
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        
+        def blur(start, stop):
+            # The first step (scale 1) samples every pixel in place
+            acc = arr[start:stop].astype(wide)
+            for sx, sy in steps:
+                acc += gather_pixels(arr, sy[start:stop], sx)
             
-            result += arr[sy, sx].astype(np.float32)
+            acc //= samples
+            result[start:stop] = acc
         
-        result = (result / samples).astype(np.uint8)
-        return numpy_to_qimage(result)
+        # Strips keep the accumulator in cache across all the steps
+        parallel_rows(blur, height, max_rows=_sample_strip_rows(width))
+        return new_img
 
 
 class BulgeDialog(QDialog):
@@ -360,6 +477,10 @@ class BulgeDialog(QDialog):
         a_layout.addWidget(self.a_slider)
         layout.addLayout(a_layout)
         
+        # Nearest sampling is fast and crisp; bilinear smooths the stretched areas
+        self.smooth_check = QCheckBox("Smooth (bilinear)")
+        layout.addWidget(self.smooth_check)
+        
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
@@ -368,7 +489,8 @@ class BulgeDialog(QDialog):
         self.setLayout(layout)
     
     def get_config(self):
-        return {"amount": self.a_slider.value()}
+        return {"amount": self.a_slider.value(),
+                "quality": "high" if self.smooth_check.isChecked() else "fast"}
 
 
 class BulgeEffect(Effect):
@@ -382,35 +504,56 @@ class BulgeEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         amount = config.get("amount", 50) / 100.0
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         cx, cy = width / 2, height / 2
         radius = min(cx, cy)
         
-        y_coords, x_coords = np.mgrid[0:height, 0:width].astype(np.float32)
-        
-        dx = x_coords - cx
-        dy = y_coords - cy
-        dist = np.sqrt(dx**2 + dy**2)
+        smooth = config.get("quality", "fast") == "high"
         
-        # Bulge formula
-        mask = (dist < radius) & (dist > 0)
-        factor = np.zeros_like(dist)
-        factor[mask] = (1 - (dist[mask] / radius)) * amount
-        new_dist = np.where(mask, dist * (1 - factor), dist)
+        # Bands write straight into the output image
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
         
-        scale = np.ones_like(dist)
-        scale[mask] = new_dist[mask] / dist[mask]
+        # Offsets as a row and a column; only the distance is full-size.
+        # The squared row is the same for every band, so it is taken once
+        dx = np.arange(width, dtype=np.float32) - cx
+        dx_sq = dx**2
         
-        sx = (cx + dx * scale).astype(np.int32)
-        sy = (cy + dy * scale).astype(np.int32)
-        
-        sx = np.clip(sx, 0, width - 1)
-        sy = np.clip(sy, 0, height - 1)
+        def bulge(start, stop):
+            dy = np.arange(start, stop, dtype=np.float32)[:, None] - cy
+            dist = np.sqrt(dx_sq + dy**2)
+            
+            # Bulge formula, evaluated densely and kept only inside the
+            # circle (scale 1 leaves every other pixel where it is)
+            mask = (dist < radius) & (dist > 0)
+            factor = dist / radius
+            np.subtract(1, factor, out=factor)
+            factor *= amount
+            np.subtract(1, factor, out=factor)
+            factor *= dist
+            scale = np.divide(factor, dist, out=np.ones_like(dist), where=mask)
+            
+            map_x = cx + dx * scale
+            map_y = cy + dy * scale
+            if smooth:
+                result[start:stop] = remap_bilinear(arr, map_x, map_y)
+                return
+            
+            sx = map_x.astype(np.int32)
+            sy = map_y.astype(np.int32)
+            
+            np.clip(sx, 0, width - 1, out=sx)
+            np.clip(sy, 0, height - 1, out=sy)
+            
+            result[start:stop] = gather_pixels(arr, sy, sx)
         
-        result = arr[sy, sx]
-        return numpy_to_qimage(result)
+        # Every output pixel depends only on its own coordinates, so the
+        # bands need no overlap. Bilinear sampling keeps whole bands, which
+        # are large enough for remap_bilinear to hand to the GPU
+        parallel_rows(bulge, height, max_rows=None if smooth else _sample_strip_rows(width))
+        return new_img
 
 
 class TwistDialog(QDialog):
@@ -428,6 +571,9 @@ class TwistDialog(QDialog):
         a_layout.addWidget(self.a_slider)
         layout.addLayout(a_layout)
         
+        self.smooth_check = QCheckBox("Smooth (bilinear)")
+        layout.addWidget(self.smooth_check)
+        
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
@@ -436,7 +582,8 @@ class TwistDialog(QDialog):
         self.setLayout(layout)
     
     def get_config(self):
-        return {"angle": self.a_slider.value()}
+        return {"angle": self.a_slider.value(),
+                "quality": "high" if self.smooth_check.isChecked() else "fast"}
 
 
 class TwistEffect(Effect):
@@ -450,32 +597,54 @@ class TwistEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         angle = math.radians(config.get("angle", 45))
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         cx, cy = width / 2, height / 2
         radius = min(cx, cy)
         
-        y_coords, x_coords = np.mgrid[0:height, 0:width].astype(np.float32)
+        smooth = config.get("quality", "fast") == "high"
         
-        dx = x_coords - cx
-        dy = y_coords - cy
-        dist = np.sqrt(dx**2 + dy**2)
+        # Bands write straight into the output image
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
         
-        # Twist amount decreases with distance from center
-        twist = np.where(dist < radius, angle * (1 - dist / radius), 0)
+        # Offsets as a row and a column; only the distance is full-size.
+        # The squared row is the same for every band, so it is taken once
+        dx = np.arange(width, dtype=np.float32) - cx
+        dx_sq = dx**2
         
-        cos_t = np.cos(twist)
-        sin_t = np.sin(twist)
-        
-        sx = (cx + dx * cos_t - dy * sin_t).astype(np.int32)
-        sy = (cy + dx * sin_t + dy * cos_t).astype(np.int32)
-        
-        sx = np.clip(sx, 0, width - 1)
-        sy = np.clip(sy, 0, height - 1)
+        def twist_rows(start, stop):
+            dy = np.arange(start, stop, dtype=np.float32)[:, None] - cy
+            dist = np.sqrt(dx_sq + dy**2)
+            
+            # Twist amount decreases with distance from center
+            inside = dist < radius
+            twist = dist / radius
+            np.subtract(1, twist, out=twist)
+            twist *= angle
+            
+            # Outside the circle the rotation is the identity, so the sines
+            # and cosines are only evaluated where they matter
+            cos_t = np.cos(twist, out=np.ones_like(twist), where=inside)
+            sin_t = np.sin(twist, out=np.zeros_like(twist), where=inside)
+            
+            map_x = cx + dx * cos_t - dy * sin_t
+            map_y = cy + dx * sin_t + dy * cos_t
+            if smooth:
+                result[start:stop] = remap_bilinear(arr, map_x, map_y)
+                return
+            
+            sx = map_x.astype(np.int32)
+            sy = map_y.astype(np.int32)
+            
+            np.clip(sx, 0, width - 1, out=sx)
+            np.clip(sy, 0, height - 1, out=sy)
+            
+            result[start:stop] = gather_pixels(arr, sy, sx)
         
-        result = arr[sy, sx]
-        return numpy_to_qimage(result)
+        parallel_rows(twist_rows, height, max_rows=None if smooth else _sample_strip_rows(width))
+        return new_img
 
 
 class DentsDialog(QDialog):
@@ -501,6 +670,9 @@ class DentsDialog(QDialog):
         s_layout.addWidget(self.s_spin)
         layout.addLayout(s_layout)
         
+        self.smooth_check = QCheckBox("Smooth (bilinear)")
+        layout.addWidget(self.smooth_check)
+        
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
@@ -509,7 +681,8 @@ class DentsDialog(QDialog):
         self.setLayout(layout)
     
     def get_config(self):
-        return {"amount": self.a_slider.value(), "scale": self.s_spin.value()}
+        return {"amount": self.a_slider.value(), "scale": self.s_spin.value(),
+                "quality": "high" if self.smooth_check.isChecked() else "fast"}
 
 
 class DentsEffect(Effect):
@@ -524,20 +697,41 @@ class DentsEffect(Effect):
         amount = config.get("amount", 10)
         scale = config.get("scale", 20)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
-        y_coords, x_coords = np.mgrid[0:height, 0:width].astype(np.float32)
-        
-        # Use sine waves for smooth dents
-        dx = (amount * np.sin(y_coords / scale * 2 * np.pi)).astype(np.int32)
-        dy = (amount * np.sin(x_coords / scale * 2 * np.pi)).astype(np.int32)
-        
-        sx = np.clip(x_coords.astype(np.int32) + dx, 0, width - 1)
-        sy = np.clip(y_coords.astype(np.int32) + dy, 0, height - 1)
+        x_coords = np.arange(width, dtype=np.float32)
+        y_coords = np.arange(height, dtype=np.float32)[:, None]
+        
+        # Use sine waves for smooth dents. The horizontal shift depends
+        # only on the row and the vertical one only on the column, so
+        # each is tabulated once and broadcast
+        dx = amount * np.sin(y_coords / scale * 2 * np.pi)
+        dy = amount * np.sin(x_coords / scale * 2 * np.pi)
+        smooth = config.get("quality", "fast") == "high"
+        if not smooth:
+            x_coords = x_coords.astype(np.int32)
+            y_coords = y_coords.astype(np.int32)
+            dx = dx.astype(np.int32)
+            dy = dy.astype(np.int32)
+        
+        # Bands write straight into the output image
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        
+        def dents(start, stop):
+            map_x = x_coords + dx[start:stop]
+            map_y = y_coords[start:stop] + dy
+            if smooth:
+                result[start:stop] = remap_bilinear(arr, map_x, map_y)
+                return
+            
+            np.clip(map_x, 0, width - 1, out=map_x)
+            np.clip(map_y, 0, height - 1, out=map_y)
+            result[start:stop] = gather_pixels(arr, map_y, map_x)
         
-        result = arr[sy, sx]
-        return numpy_to_qimage(result)
+        parallel_rows(dents, height, max_rows=None if smooth else _sample_strip_rows(width))
+        return new_img
 
 
 class Rotate3DDialog(QDialog):
@@ -582,6 +776,9 @@ class Rotate3DDialog(QDialog):
         z_layout.addWidget(self.z_val)
         layout.addLayout(z_layout)
         
+        self.smooth_check = QCheckBox("Smooth (bilinear)")
+        layout.addWidget(self.smooth_check)
+        
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
@@ -592,7 +789,8 @@ class Rotate3DDialog(QDialog):
         return {
             "rotate_x": self.rx_slider.value(),
             "rotate_y": self.ry_slider.value(),
-            "zoom": self.z_slider.value()
+            "zoom": self.z_slider.value(),
+            "quality": "high" if self.smooth_check.isChecked() else "fast"
         }
 
 
@@ -609,48 +807,80 @@ class Rotate3DEffect(Effect):
         rotate_y = config.get("rotate_y", 0)
         zoom = config.get("zoom", 100) / 100.0
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         cx, cy = width / 2, height / 2
         
-        result = np.zeros_like(arr)
-        
         ax = math.radians(rotate_x)
         ay = math.radians(rotate_y)
+        cos_x, sin_x = np.cos(ax), np.sin(ax)
+        cos_y, sin_y = np.cos(ay), np.sin(ay)
         
         focal_length = max(width, height) * 2
         
-        y_coords, x_coords = np.mgrid[0:height, 0:width].astype(np.float32)
-        
-        # Normalize to center
-        nx = (x_coords - cx) / zoom
-        ny = (y_coords - cy) / zoom
-        nz = np.zeros_like(nx)
-        
-        # Rotate around X axis
-        y1 = ny * np.cos(ax) - nz * np.sin(ax)
-        z1 = ny * np.sin(ax) + nz * np.cos(ax)
-        
-        # Rotate around Y axis
-        x2 = nx * np.cos(ay) + z1 * np.sin(ay)
-        z2 = -nx * np.sin(ay) + z1 * np.cos(ay)
-        
-        # Perspective projection
-        valid = (focal_length + z2) > 0
-        scale = np.where(valid, focal_length / (focal_length + z2), 1)
-        
-        sx = (x2 * scale + cx).astype(np.int32)
-        sy = (y1 * scale + cy).astype(np.int32)
-        
-        # Check bounds and sample
-        valid_mask = valid & (sx >= 0) & (sx < width) & (sy >= 0) & (sy < height)
-        
-        for i in range(height):
-            for j in range(width):
-                if valid_mask[i, j]:
-                    result[i, j] = arr[sy[i, j], sx[i, j]]
+        if config.get("quality", "fast") == "high":
+            # The projection below is a homography: both the projected point
+            # and the perspective divisor are linear in the output pixel. As
+            # a QTransform (row vectors) from output to source pixels, it
+            # lets Qt's raster engine paint the whole source through the
+            # inverse in one bilinear pass. The half-pixel shifts line Qt's
+            # pixel centres up with the sample points of the nearest path
+            to_centre = QTransform(1 / zoom, 0, 0, 0, 1 / zoom, 0, -cx / zoom, -cy / zoom, 1)
+            project = QTransform(
+                focal_length * cos_y - cx * sin_y, -cy * sin_y, -sin_y,
+                (focal_length * sin_y + cx * cos_y) * sin_x,
+                focal_length * cos_x + cy * sin_x * cos_y, sin_x * cos_y,
+                cx * focal_length, cy * focal_length, focal_length,
+            )
+            to_source = (QTransform.fromTranslate(-0.5, -0.5) * to_centre * project
+                         * QTransform.fromTranslate(0.5, 0.5))
+            to_output, invertible = to_source.inverted()
+            
+            new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+            new_img.fill(Qt.GlobalColor.transparent)
+            if invertible:
+                painter = QPainter(new_img)
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+                painter.setTransform(to_output)
+                painter.drawImage(0, 0, image)
+                painter.end()
+            return new_img
+        
+        # Normalize to center, as a row of x offsets and a column of y offsets
+        nx = (np.arange(width, dtype=np.float32) - cx) / zoom
+        ny = (np.arange(height, dtype=np.float32)[:, None] - cy) / zoom
+        
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        
+        def rotate(start, stop):
+            # Rotate around X axis. The image plane starts at z = 0, so this
+            # step depends on the row alone
+            y1 = ny[start:stop] * cos_x
+            z1 = ny[start:stop] * sin_x
+            
+            # Rotate around Y axis
+            x2 = nx * cos_y + z1 * sin_y
+            z2 = -nx * sin_y + z1 * cos_y
+            
+            # Perspective projection
+            valid = (focal_length + z2) > 0
+            scale = np.where(valid, focal_length / (focal_length + z2), 1)
+            
+            sx = (x2 * scale + cx).astype(np.int32)
+            sy = (y1 * scale + cy).astype(np.int32)
+            
+            # Sample in bounds; everything projected off the image is transparent
+            valid &= (sx >= 0) & (sx < width) & (sy >= 0) & (sy < height)
+            np.clip(sx, 0, width - 1, out=sx)
+            np.clip(sy, 0, height - 1, out=sy)
+            
+            pixels = gather_pixels(arr, sy, sx)
+            pixels[~valid] = 0
+            result[start:stop] = pixels
         
-        return numpy_to_qimage(result)
+        parallel_rows(rotate, height, max_rows=_sample_strip_rows(width))
+        return new_img
 
 
 class PolarInversionDialog(QDialog):
@@ -692,39 +922,54 @@ class PolarInversionEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         amount = config.get("amount", 100) / 100.0
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         cx, cy = width / 2, height / 2
         max_radius = np.sqrt(cx * cx + cy * cy)
         
-        result = np.zeros_like(arr)
-        
-        y_coords, x_coords = np.mgrid[0:height, 0:width].astype(np.float32)
+        # Coordinates as a row of x terms and a column of y terms; only the
+        # final source maps are full-size
+        x_coords = np.arange(width, dtype=np.float32)
+        y_coords = np.arange(height, dtype=np.float32)[:, None]
         
         if amount > 0:
             # Rectangular to Polar
             dx = x_coords - cx
             dy = y_coords - cy
-            r = np.sqrt(dx * dx + dy * dy)
-            theta = np.arctan2(dy, dx)
             
-            sx = ((theta + np.pi) / (2 * np.pi) * width).astype(np.int32)
-            sy = (r / max_radius * height).astype(np.int32)
+            def source(start, stop):
+                band_dy = dy[start:stop]
+                r = np.sqrt(dx * dx + band_dy * band_dy)
+                theta = np.arctan2(band_dy, dx)
+                
+                sx = ((theta + np.pi) / (2 * np.pi) * width).astype(np.int32)
+                sy = (r / max_radius * height).astype(np.int32)
+                return sx, sy
         else:
-            # Polar to Rectangular
+            # Polar to Rectangular: the angle follows the column and the
+            # radius the row, so the trig runs once per column
             norm_x = x_coords / width
             norm_y = y_coords / height
             new_theta = norm_x * 2 * np.pi - np.pi
             new_r = norm_y * max_radius
+            cos_t, sin_t = np.cos(new_theta), np.sin(new_theta)
             
-            sx = (cx + new_r * np.cos(new_theta)).astype(np.int32)
-            sy = (cy + new_r * np.sin(new_theta)).astype(np.int32)
-        
-        sx = np.clip(sx, 0, width - 1)
-        sy = np.clip(sy, 0, height - 1)
-        
-        result = arr[sy, sx]
-        return numpy_to_qimage(result)
+            def source(start, stop):
+                sx = (cx + new_r[start:stop] * cos_t).astype(np.int32)
+                sy = (cy + new_r[start:stop] * sin_t).astype(np.int32)
+                return sx, sy
+        
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        
+        def invert(start, stop):
+            sx, sy = source(start, stop)
+            np.clip(sx, 0, width - 1, out=sx)
+            np.clip(sy, 0, height - 1, out=sy)
+            result[start:stop] = gather_pixels(arr, sy, sx)
+        
+        parallel_rows(invert, height, max_rows=_sample_strip_rows(width))
+        return new_img
 
 
 class FrostedGlassDialog(QDialog):
@@ -766,22 +1011,36 @@ class FrostedGlassEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         amount = config.get("amount", 4)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
-        # Create random offsets within the scatter radius
+        # Create random offsets within the scatter radius. The legacy
+        # generator draws the same stream for int32 as for the default
+        # int64, at half the memory
         np.random.seed(42)  # For reproducibility
-        offset_x = np.random.randint(-amount, amount + 1, size=(height, width))
-        offset_y = np.random.randint(-amount, amount + 1, size=(height, width))
-        
-        # Create coordinate grids
-        y_coords, x_coords = np.mgrid[0:height, 0:width]
-        
-        # Apply offsets
-        src_x = np.clip(x_coords + offset_x, 0, width - 1)
-        src_y = np.clip(y_coords + offset_y, 0, height - 1)
-        
-        # Sample from offset positions
-        result = arr[src_y, src_x]
+        offset_x = np.random.randint(-amount, amount + 1, size=(height, width), dtype=np.int32)
+        offset_y = np.random.randint(-amount, amount + 1, size=(height, width), dtype=np.int32)
+        
+        columns = np.arange(width, dtype=np.int32)
+        rows = np.arange(height, dtype=np.int32)[:, None]
+        
+        new_img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        result = qimage_view(new_img, writable=True)
+        
+        def scatter(start, stop):
+            # Apply offsets in place; a broadcast row and column of coordinates
+            # stand in for full-size grids
+            src_x = offset_x[start:stop]
+            src_x += columns
+            np.clip(src_x, 0, width - 1, out=src_x)
+            src_y = offset_y[start:stop]
+            src_y += rows[start:stop]
+            np.clip(src_y, 0, height - 1, out=src_y)
+            
+            # Sample from offset positions
+            result[start:stop] = gather_pixels(arr, src_y, src_x)
         
-        return numpy_to_qimage(result)
+        # The offsets are drawn up front so the seeded stream stays the
+        # same; only the index arithmetic and the gather run in strips
+        parallel_rows(scatter, height, max_rows=_sample_strip_rows(width))
+        return new_img
@@ -7,10 +7,10 @@ from PySide6.QtGui import QImage, QColor
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QSlider, QDialogButtonBox, QSpinBox, QWidget,
                                QComboBox, QCheckBox)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPainter, QPen, QBrush
+from PySide6.QtCore import Qt, Signal, QPoint
+from PySide6.QtGui import QPainter, QPen, QBrush, QPolygon
 from ..core.effects import Effect
-from ..utils.image_processing import qimage_to_numpy, numpy_to_qimage, apply_lut
+from ..utils.image_processing import qimage_view, numpy_to_qimage, apply_lut
 import numpy as np
 import math
 
@@ -51,15 +51,10 @@ class CurvesWidget(QWidget):
         
         # Curve
         painter.setPen(QPen(QColor(200, 200, 200), 2))
-        prev = None
-        for i in range(256):
-            x = i / 255.0
-            y = self.evaluate(x)
-            px = int(x * self.width())
-            py = int((1 - y) * self.height())
-            if prev:
-                painter.drawLine(prev[0], prev[1], px, py)
-            prev = (px, py)
+        xs = np.arange(256) / 255.0
+        pxs = (xs * self.width()).astype(int)
+        pys = ((1 - self.evaluate_many(xs)) * self.height()).astype(int)
+        painter.drawPolyline(QPolygon([QPoint(px, py) for px, py in zip(pxs.tolist(), pys.tolist())]))
         
         # Control points
         for i, (x, y) in enumerate(self.points):
@@ -83,6 +78,17 @@ class CurvesWidget(QWidget):
                 return self.points[i][1] + t * (self.points[i+1][1] - self.points[i][1])
         return x
     
+    def evaluate_many(self, xs: np.ndarray) -> np.ndarray:
+        """Vectorized evaluate() over an array of x values (same arithmetic)."""
+        px = np.array([p[0] for p in self.points])
+        py = np.array([p[1] for p in self.points])
+        
+        # First segment whose closed range contains x, as in evaluate()
+        i = np.clip(np.searchsorted(px, xs, side='left') - 1, 0, len(px) - 2)
+        t = (xs - px[i]) / (px[i + 1] - px[i] + 0.0001)
+        ys = py[i] + t * (py[i + 1] - py[i])
+        return np.where((xs < px[0]) | (xs > px[-1]), xs, ys)
+    
     def mousePressEvent(self, event):
         x = event.position().x() / self.width()
         y = 1 - event.position().y() / self.height()
@@ -135,11 +141,8 @@ class CurvesWidget(QWidget):
     
     def get_lut(self) -> list:
         """Generate lookup table from curve."""
-        lut = []
-        for i in range(256):
-            val = self.evaluate(i / 255.0)
-            lut.append(int(max(0, min(255, val * 255))))
-        return lut
+        vals = self.evaluate_many(np.arange(256) / 255.0)
+        return np.clip(vals * 255, 0, 255).astype(int).tolist()
 
 
 class CurvesDialog(QDialog):
@@ -187,7 +190,7 @@ class CurvesEffect(Effect):
         channel = config.get("channel", "RGB")
         
         lut = np.array(lut_list, dtype=np.uint8)
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         result = arr.copy()
         
         # BGRA format: B=0, G=1, R=2
@@ -287,7 +290,7 @@ class LevelsEffect(Effect):
         lut = out_black + lut * out_range
         lut = np.clip(lut, 0, 255).astype(np.uint8)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         result = apply_lut(arr, lut, channels=(0, 1, 2))
         return numpy_to_qimage(result)
 
@@ -344,7 +347,7 @@ class VignetteEffect(Effect):
         amount = config.get("amount", 50) / 100.0
         softness = config.get("softness", 50) / 100.0 + 0.5
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         cx, cy = width / 2, height / 2
@@ -417,7 +420,7 @@ class OilPaintingEffect(Effect):
         radius = config.get("radius", 3)
         intensity = config.get("intensity", 20)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Compute grayscale for quantization
@@ -498,7 +501,7 @@ class PosterizeEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         levels = config.get("levels", 4)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         step = 256 // levels
         
         result = arr.copy()
@@ -517,7 +520,7 @@ class BlackWhiteEffect(Effect):
     category = "Adjustments"
     
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         
         # Weighted grayscale (luminosity) - BGRA format
         gray = (arr[:, :, 2].astype(np.float32) * 0.299 + 
@@ -583,7 +586,7 @@ class RedEyeRemovalEffect(Effect):
         tolerance = config.get("tolerance", 50) / 100.0
         sat_threshold = config.get("saturation", 70) / 100.0
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         result = arr.copy()
         
         # BGRA format
@@ -665,7 +668,7 @@ class SurfaceBlurEffect(Effect):
         radius = config.get("radius", 3)
         threshold = config.get("threshold", 30)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Calculate luminance
@@ -5,9 +5,8 @@ from PySide6.QtGui import QImage, QColor
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QDialogButtonBox, QSpinBox
 from PySide6.QtCore import Qt
 from ..core.effects import Effect
-from ..utils.image_processing import qimage_to_numpy, numpy_to_qimage
+from ..utils.image_processing import qimage_view, numpy_to_qimage
 import numpy as np
-from scipy.ndimage import uniform_filter, sobel
 
 
 class GlowDialog(QDialog):
@@ -56,12 +55,14 @@ class GlowEffect(Effect):
         radius = config.get("radius", 5)
         brightness = config.get("brightness", 50) / 100.0
         
-        arr = qimage_to_numpy(image).astype(np.float32)
+        arr = qimage_view(image).astype(np.float32)
         
         # Compute luminance for weighting
         lum = (arr[:, :, 0] + arr[:, :, 1] + arr[:, :, 2]) / (3 * 255.0)
         
         # Create glow (weighted blur of bright areas)
+        from scipy.ndimage import uniform_filter
+        
         kernel_size = 2 * radius + 1
         glow = np.zeros_like(arr, dtype=np.float32)
         
@@ -87,7 +88,7 @@ class OutlineEffect(Effect):
     category = "Stylize"
     
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         
         # Convert to grayscale
         gray = (arr[:, :, 0].astype(np.float32) + 
@@ -95,6 +96,8 @@ class OutlineEffect(Effect):
                 arr[:, :, 2].astype(np.float32)) / 3.0
         
         # Sobel edge detection
+        from scipy.ndimage import sobel
+        
         gx = sobel(gray, axis=1)
         gy = sobel(gray, axis=0)
         magnitude = np.sqrt(gx**2 + gy**2)
@@ -157,7 +160,7 @@ class FragmentEffect(Effect):
         count = config.get("count", 4)
         distance = config.get("distance", 5)
         
-        arr = qimage_to_numpy(image).astype(np.float32)
+        arr = qimage_view(image).astype(np.float32)
         height, width = arr.shape[:2]
         
         result = np.zeros_like(arr, dtype=np.float32)
@@ -187,7 +190,7 @@ class CloudsEffect(Effect):
     category = "Render"
     
     def apply(self, image: QImage, config: dict) -> QImage:
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Create coordinate grids
@@ -252,7 +255,7 @@ class TileReflectionEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         tile_size = config.get("tile_size", 40)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Create coordinate grids
@@ -330,7 +333,7 @@ class JuliaFractalEffect(Effect):
         max_iter = config.get("quality", 100)
         zoom = config.get("zoom", 3.0)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Julia set constant (for a nice pattern)
@@ -412,7 +415,7 @@ class MandelbrotFractalEffect(Effect):
         max_iter = config.get("quality", 100)
         zoom = config.get("zoom", 2.5)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Center on the interesting part of Mandelbrot set
@@ -6,7 +6,7 @@ from PySide6.QtGui import QImage, QColor, QPainter
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QDialogButtonBox, QSpinBox, QCheckBox
 from PySide6.QtCore import Qt
 from ..core.effects import Effect
-from ..utils.image_processing import qimage_to_numpy, numpy_to_qimage, gaussian_blur_np, box_blur_np
+from ..utils.image_processing import qimage_view, numpy_to_qimage, gaussian_blur_np, box_blur_np
 import numpy as np
 import math
 
@@ -88,17 +88,11 @@ class DropShadowEffect(Effect):
         blur = config.get("blur", 10)
         opacity = config.get("opacity", 60) / 100.0
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
-        # Create shadow from alpha channel
-        shadow = np.zeros_like(arr)
-        
-        # Shift alpha to create shadow at offset position
-        alpha = arr[:, :, 3].astype(np.float32) * opacity
-        
-        # Create shifted shadow
-        shadow_alpha = np.zeros((height, width), dtype=np.float32)
+        # Shadow coverage: the layer's alpha scaled by opacity, at the offset
+        shadow_alpha = np.zeros((height, width), dtype=np.uint8)
         
         # Calculate valid source and destination ranges
         src_y_start = max(0, -offset_y)
@@ -111,27 +105,28 @@ class DropShadowEffect(Effect):
         dst_x_start = max(0, offset_x)
         dst_x_end = min(width, width + offset_x)
         
-        # Copy shifted alpha
+        # Copy shifted alpha; only the covered region is scaled
         if dst_y_end > dst_y_start and dst_x_end > dst_x_start:
             shadow_alpha[dst_y_start:dst_y_end, dst_x_start:dst_x_end] = \
-                alpha[src_y_start:src_y_end, src_x_start:src_x_end]
+                arr[src_y_start:src_y_end, src_x_start:src_x_end, 3] * np.float32(opacity)
         
         # Blur shadow alpha if needed
         if blur > 0:
-            shadow_alpha = gaussian_blur_np(shadow_alpha.astype(np.uint8), blur / 3.0).astype(np.float32)
-        
-        # Create shadow layer (black with alpha)
-        shadow[:, :, 3] = shadow_alpha.astype(np.uint8)
+            shadow_alpha = gaussian_blur_np(shadow_alpha, blur / 3.0)
         
         # Composite: shadow first, then original on top
-        # Alpha blending: result = fg * fg_alpha + bg * (1 - fg_alpha)
+        # Alpha blending: result = fg * fg_alpha + bg * (1 - fg_alpha). The
+        # shadow is black, so the colour channels are just fg * fg_alpha:
+        # one float cast of B, G, R, and no float copy of the shadow at all
         fg_alpha = arr[:, :, 3:4].astype(np.float32) / 255.0
-        bg_alpha = shadow[:, :, 3:4].astype(np.float32) / 255.0
+        rgb = arr[:, :, :3].astype(np.float32)
+        rgb *= fg_alpha
         
-        result = arr.astype(np.float32) * fg_alpha + shadow.astype(np.float32) * (1 - fg_alpha)
-        result[:, :, 3] = np.maximum(arr[:, :, 3], shadow[:, :, 3])
+        result = np.empty_like(arr)
+        result[:, :, :3] = rgb
+        np.maximum(arr[:, :, 3], shadow_alpha, out=result[:, :, 3])
         
-        return numpy_to_qimage(np.clip(result, 0, 255).astype(np.uint8))
+        return numpy_to_qimage(result)
 
 
 class ChannelShiftDialog(QDialog):
@@ -205,7 +200,7 @@ class ChannelShiftEffect(Effect):
         blue_x = config.get("blue_x", 5)
         blue_y = config.get("blue_y", 0)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         result = arr.copy()
@@ -275,7 +270,7 @@ class BokehBlurEffect(Effect):
         radius = config.get("radius", 8)
         brightness = config.get("brightness", 20) / 100.0
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Create circular kernel points
@@ -287,7 +282,7 @@ class BokehBlurEffect(Effect):
         
         kernel_count = len(kernel_points)
         if kernel_count == 0:
-            return image.copy()
+            return image
         
         result = np.zeros((height, width, 4), dtype=np.float32)
         weight_sum = np.zeros((height, width), dtype=np.float32)
@@ -369,7 +364,7 @@ class SketchBlurEffect(Effect):
         radius = config.get("radius", 3)
         threshold = config.get("threshold", 30)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Calculate luminance
@@ -442,7 +437,7 @@ class ReliefEffect(Effect):
     def apply(self, image: QImage, config: dict) -> QImage:
         angle = config.get("angle", 315)
         
-        arr = qimage_to_numpy(image)
+        arr = qimage_view(image)
         height, width = arr.shape[:2]
         
         # Convert to grayscale
@@ -997,6 +997,8 @@ class MainWindow(QMainWindow):
         config = {}
         dlg = effect.create_dialog(self)
         if dlg:
+            if hasattr(dlg, "set_preview_source"):
+                dlg.set_preview_source(layer.image, effect)
             if dlg.exec():
                 config = dlg.get_config()
             else:
@@ -1011,8 +1013,10 @@ class MainWindow(QMainWindow):
         
         # Execute synchronously but with UI update
         try:
-            # Copy image for processing (safer for memory)
-            src_image = layer.image.copy()
+            # Shallow, implicitly shared handle: effects only read their input
+            # through qimage_view(), and Qt detaches before any write could
+            # reach the layer, so a deep copy would only cost a full-image pass
+            src_image = QImage(layer.image)
             
             # Apply effect
             new_img = effect.apply(src_image, config)
@@ -7,48 +7,137 @@ and vectorized implementations of common image processing operations.
 IMPORTANT: Qt uses BGRA order on little-endian systems and premultiplied alpha.
 This module provides helpers to handle this correctly.
 """
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import numpy as np
 from PySide6.QtGui import QImage, QColor
 from typing import Tuple
 
+try:
+    import cv2
+except ImportError:  # OpenCV is an optional accelerator
+    cv2 = None
 
-def qimage_to_numpy(img: QImage, unpremultiply: bool = False) -> np.ndarray:
+
+@lru_cache(maxsize=None)
+def _gpu():
+    """Return ``(cupy, cupyx.scipy.ndimage)``, or None without a usable GPU.
+
+    CuPy is only imported, and the CUDA driver only probed, the first time an
+    image is large enough for the GPU paths; both take far longer than the
+    rest of the start-up imports combined.
     """
-    Convert a QImage to a NumPy array.
+    try:
+        import cupy
+        from cupyx.scipy import ndimage as cupy_ndimage
+    except ImportError:  # CUDA (via CuPy) is an optional accelerator
+        return None
+    if not cupy.cuda.is_available():
+        return None
+    return cupy, cupy_ndimage
+
+
+# Shared workers for parallel_channels(); NumPy and SciPy's filters release
+# the GIL, so the channels run concurrently
+_CHAN_WORKERS = min(3, os.cpu_count() or 1)
+_CHAN_POOL = ThreadPoolExecutor(max_workers=_CHAN_WORKERS, thread_name_prefix="aphelion-chan")
+
+# Workers for parallel_rows(); bands smaller than _BAND_MIN_ROWS are not worth
+# a thread hand-off, so small images (and single-core hosts) run inline
+_ROW_WORKERS = os.cpu_count() or 1
+_ROW_POOL = ThreadPoolExecutor(max_workers=_ROW_WORKERS, thread_name_prefix="aphelion-rows")
+_BAND_MIN_ROWS = 64
+
+# Target size of one float32 strip in gaussian_blur_np's NumPy path: small
+# enough that the vertical pass still finds the horizontal output in cache
+_BLUR_STRIP_BYTES = 4 << 20
+
+# Below these sizes the host<->GPU copies cost more than the blur (or the
+# bilinear remap without OpenCV) itself, and the CPU paths win
+_GPU_MIN_ELEMENTS = 2_000_000
+_GPU_MIN_KERNEL = 2 * 16 + 1
+
+# Below this many pixels, building the 64K-entry pair tables in
+# apply_channel_luts costs more than the gather pass it saves
+_PAIR_LUT_MIN_PIXELS = 1 << 16
+
+# Sepia weights as a BGRA -> BGRA matrix (rows are output B, G, R, A)
+_SEPIA_BGRA = np.array([
+    [0.131, 0.534, 0.272, 0.0],
+    [0.168, 0.686, 0.349, 0.0],
+    [0.189, 0.769, 0.393, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+], dtype=np.float32)
+
+
+_VIEW_FORMATS = (QImage.Format.Format_ARGB32,
+                 QImage.Format.Format_ARGB32_Premultiplied,
+                 QImage.Format.Format_RGB32)
+
+
+def qimage_view(img: QImage, writable: bool = False) -> np.ndarray:
+    """
+    Get a zero-copy NumPy view of a 32-bit QImage's pixels.
+    
+    The view does NOT keep the QImage alive: hold a reference to `img` for as
+    long as the array is in use, or the array will point at freed memory.
     
     Args:
-        img: QImage to convert
-        unpremultiply: If True, convert from premultiplied to straight alpha.
-                       Set to True for effects that do RGB math (otherwise you
-                       get mysterious darkening artifacts).
+        img: QImage in ARGB32, ARGB32_Premultiplied or RGB32 format. Other
+             formats are converted, which returns an owned copy instead of a view
+             (not allowed with writable=True).
+        writable: If False (default), the view is read-only and built on
+                  constBits(), so it never detaches implicitly shared image data.
+                  If True, writes through the view modify `img`.
     
     Returns:
         np.ndarray: Shape (height, width, 4) with BGRA order.
-                    Channels are [Blue, Green, Red, Alpha] on little-endian systems.
     """
-    # Ensure we have a compatible format
-    if img.format() not in (QImage.Format.Format_ARGB32, 
-                            QImage.Format.Format_ARGB32_Premultiplied,
-                            QImage.Format.Format_RGB32):
+    if img.format() not in _VIEW_FORMATS:
+        if writable:
+            raise ValueError(f"Cannot create a writable view of a {img.format()} image")
         img = img.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        return qimage_view(img).copy()
     
     width = img.width()
     height = img.height()
     bytes_per_line = img.bytesPerLine()
     
-    # Get pointer to image data
     # Handle both older (voidptr with setsize) and newer (memoryview) PySide6
-    ptr = img.bits()
+    ptr = img.bits() if writable else img.constBits()
     if hasattr(ptr, 'setsize'):
         ptr.setsize(img.sizeInBytes())
-        arr = np.frombuffer(ptr, dtype=np.uint8).reshape((height, bytes_per_line))
-    else:
-        # ptr is already a memoryview
-        arr = np.asarray(ptr, dtype=np.uint8).reshape((height, bytes_per_line))
+    arr = np.frombuffer(ptr, dtype=np.uint8).reshape((height, bytes_per_line))
     
     # Slice to actual width (bytes_per_line may include padding)
     # First width*4 bytes are pixels, remainder is padding
-    arr = arr[:, :width * 4].reshape((height, width, 4)).copy()
+    return arr[:, :width * 4].reshape((height, width, 4))
+
+
+def qimage_to_numpy(img: QImage, unpremultiply: bool = False) -> np.ndarray:
+    """
+    Convert a QImage to a NumPy array.
+    
+    Returns an owned copy; use qimage_view() to read pixels without copying.
+    
+    Args:
+        img: QImage to convert
+        unpremultiply: If True, convert from premultiplied to straight alpha.
+                       Set to True for effects that do RGB math (otherwise you
+                       get mysterious darkening artifacts).
+    
+    Returns:
+        np.ndarray: Shape (height, width, 4) with BGRA order.
+                    Channels are [Blue, Green, Red, Alpha] on little-endian systems.
+    """
+    # Ensure we have a compatible format
+    if img.format() not in _VIEW_FORMATS:
+        img = img.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    
+    arr = qimage_view(img).copy()
     
     if unpremultiply and img.format() == QImage.Format.Format_ARGB32_Premultiplied:
         arr = unpremultiply_alpha(arr)
@@ -69,26 +158,219 @@ def numpy_to_qimage(arr: np.ndarray, premultiply: bool = False) -> QImage:
         QImage in ARGB32_Premultiplied format
     """
     if arr.dtype != np.uint8:
-        arr = np.clip(arr, 0, 255).astype(np.uint8)
+        # The uint8 cast happens in the final store below
+        arr = np.clip(arr, 0, 255)
+    
+    if premultiply:
+        if len(arr.shape) == 2:
+            arr = np.stack([arr, arr, arr, np.full_like(arr, 255)], axis=-1)
+        arr = premultiply_alpha(arr.astype(np.uint8, copy=False))
+    
+    height, width = arr.shape[:2]
+    img = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
     
+    # Store straight into the image's own buffer: a single pass that also
+    # handles strided or reversed views without an intermediate contiguous copy
+    out = qimage_view(img, writable=True)
     if len(arr.shape) == 2:
-        # Grayscale - expand to BGRA
-        arr = np.stack([arr, arr, arr, np.full_like(arr, 255)], axis=-1)
+        # Grayscale - expand to opaque BGRA as one 32-bit store per pixel
+        pixels = out.view('<u4')[:, :, 0]
+        np.multiply(arr.astype(np.uint8, copy=False), np.uint32(0x010101),
+                    out=pixels, dtype=np.uint32)
+        pixels |= np.uint32(0xFF000000)
+    else:
+        out[...] = arr
+    return img
+
+
+def to_planes(arr: np.ndarray, channels: int = 3) -> np.ndarray:
+    """
+    Deinterleave pixels into contiguous per-channel planes.
     
-    if premultiply:
-        arr = premultiply_alpha(arr)
+    Per-channel reductions and elementwise math over interleaved BGRA walk
+    memory with a 4-byte stride; over planes they are unit-stride passes.
+    Filters gain nothing from it: SciPy copies each line into a contiguous
+    buffer anyway, OpenCV vectorizes packed pixels, and interleaving the
+    result again costs more than the passes save.
+    
+    Args:
+        arr: Image array (H, W, C)
+        channels: Number of leading channels to extract (3 = B, G, R)
+        
+    Returns:
+        Owned (channels, H, W) array in the same dtype
+    """
+    return np.ascontiguousarray(arr[:, :, :channels].transpose(2, 0, 1))
+
+
+def gather_pixels(arr: np.ndarray, sy: np.ndarray, sx: np.ndarray) -> np.ndarray:
+    """
+    Same result as arr[sy, sx], for in-range integer index maps (which
+    may broadcast, e.g. a column of rows against a row of columns).
+    
+    Each BGRA pixel is fetched as one 32-bit word with a single flat
+    take(), several times faster than fancy-indexing four bytes per pixel.
+    
+    Args:
+        arr: Image array (H, W, 4) uint8
+        sy: Source row for each output pixel
+        sx: Source column for each output pixel
+        
+    Returns:
+        Array of the broadcast index shape + (4,)
+    """
+    packed = np.ascontiguousarray(arr).view(np.uint32).reshape(-1)
+    index = sy * arr.shape[1] + sx
+    return packed.take(index).view(np.uint8).reshape(index.shape + (4,))
+
+
+def remap_bilinear(arr: np.ndarray, map_x: np.ndarray, map_y: np.ndarray) -> np.ndarray:
+    """
+    Sample arr at fractional source coordinates with bilinear filtering.
+    
+    Pixel (x, y) sits at integer coordinates, so an identity map returns
+    the image unchanged. Samples beyond the border repeat the edge pixel.
+    
+    Args:
+        arr: Image array (H, W, 4) uint8
+        map_x: Source x for each output pixel (broadcasts with map_y)
+        map_y: Source y for each output pixel
+        
+    Returns:
+        Array of the broadcast map shape + (4,)
+    """
+    map_x, map_y = np.broadcast_arrays(np.asarray(map_x, dtype=np.float32),
+                                       np.asarray(map_y, dtype=np.float32))
+    if cv2 is not None:
+        return cv2.remap(arr, np.ascontiguousarray(map_x), np.ascontiguousarray(map_y),
+                         cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+    
+    if map_x.size * 4 >= _GPU_MIN_ELEMENTS and _gpu() is not None:
+        return _remap_bilinear_gpu(arr, map_x, map_y)
     
     height, width = arr.shape[:2]
+    x0 = np.floor(map_x)
+    y0 = np.floor(map_y)
+    wx = (map_x - x0)[..., None]
+    wy = (map_y - y0)[..., None]
+    x0 = x0.astype(np.int32)
+    y0 = y0.astype(np.int32)
+    x1 = np.clip(x0 + 1, 0, width - 1)
+    y1 = np.clip(y0 + 1, 0, height - 1)
+    np.clip(x0, 0, width - 1, out=x0)
+    np.clip(y0, 0, height - 1, out=y0)
+    
+    # Blend along x on the two source rows, then between the rows
+    top = gather_pixels(arr, y0, x0).astype(np.float32)
+    top += (gather_pixels(arr, y0, x1) - top) * wx
+    bottom = gather_pixels(arr, y1, x0).astype(np.float32)
+    bottom += (gather_pixels(arr, y1, x1) - bottom) * wx
+    top += (bottom - top) * wy
+    return np.rint(top, out=top).astype(np.uint8)
+
+
+def _remap_bilinear_gpu(arr: np.ndarray, map_x: np.ndarray, map_y: np.ndarray) -> np.ndarray:
+    """remap_bilinear's four gathers and blends on the GPU: one upload, one download."""
+    cupy, cupy_ndimage = _gpu()
+    source = cupy.asarray(arr)
+    coords = cupy.asarray(np.stack((map_y, map_x)))
+    out = cupy.empty(map_x.shape + (4,), dtype=cupy.uint8)
+    for c in range(4):
+        # 'nearest' repeats the edge pixel like BORDER_REPLICATE
+        sampled = cupy_ndimage.map_coordinates(source[:, :, c].astype(cupy.float32), coords,
+                                               order=1, mode='nearest')
+        cupy.rint(sampled, out=sampled)
+        out[:, :, c] = cupy.clip(sampled, 0, 255).astype(cupy.uint8)
+    return cupy.asnumpy(out)
+
+
+# Scratch buffers reused across repeated effect applications (slider previews,
+# adjustment layers re-rendering). Only buffers matching the most recently
+# released image size are kept, so switching documents does not pin memory.
+_SCRATCH_PER_KEY = 2
+_scratch: dict = {}
+_scratch_lock = threading.Lock()  # parallel_rows() bands share the pool
+
+
+def get_scratch(shape: tuple, dtype=np.uint8) -> np.ndarray:
+    """
+    Return an uninitialized array, reusing a released buffer when one fits.
+    
+    Pair with release_scratch() once the contents are no longer needed
+    (e.g. after numpy_to_qimage(), which copies).
+    """
+    with _scratch_lock:
+        pool = _scratch.get((tuple(shape), np.dtype(dtype)))
+        if pool:
+            return pool.pop()
+    return np.empty(shape, dtype=dtype)
+
+
+def release_scratch(arr: np.ndarray) -> None:
+    """Hand a buffer from get_scratch() back for reuse. Do not touch it afterwards."""
+    size = arr.shape[:2]
+    with _scratch_lock:
+        for key in [k for k in _scratch if k[0][:2] != size]:
+            del _scratch[key]
+        pool = _scratch.setdefault((arr.shape, arr.dtype), [])
+        if len(pool) < _SCRATCH_PER_KEY:
+            pool.append(arr)
+
+
+def parallel_rows(fn, height: int, max_rows: int = None) -> None:
+    """
+    Call fn(start, stop) over horizontal bands covering rows [0, height).
+    
+    Bands run concurrently on a shared pool (NumPy releases the GIL inside
+    ufuncs), so each call must only write its own rows of the output. Kernels
+    that read neighbouring rows (e.g. Sobel) should widen their input slice
+    themselves and trim the result. `fn` must not call parallel_rows() again.
+    
+    Args:
+        fn: Callable taking (start, stop) row indices
+        height: Total number of rows
+        max_rows: Optional cap on the rows per call. Each band is then walked
+                  as consecutive strips, so kernels with several full-size
+                  temporaries per row keep them in cache
+    """
+    if max_rows is not None:
+        whole = fn
+        
+        def fn(start, stop):
+            for y0 in range(start, stop, max_rows):
+                whole(y0, min(y0 + max_rows, stop))
+    
+    bands = min(_ROW_WORKERS, height // _BAND_MIN_ROWS)
+    if bands <= 1:
+        fn(0, height)
+        return
+    
+    bounds = np.linspace(0, height, bands + 1).astype(int)
+    for future in [_ROW_POOL.submit(fn, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]:
+        future.result()
+
+
+def parallel_channels(fn, channels) -> None:
+    """
+    Call fn(c) for each channel index in `channels` on the shared channel pool.
     
-    # Ensure contiguous array
-    arr = np.ascontiguousarray(arr)
+    For independent per-channel passes in code that releases the GIL
+    (NumPy, SciPy's ndimage filters). Each call must only write its own
+    channel of the output and must not call parallel_channels() again.
+    Runs inline on single-core hosts.
     
-    # Create QImage from data
-    img = QImage(arr.data, width, height, arr.strides[0], 
-                 QImage.Format.Format_ARGB32_Premultiplied)
+    Args:
+        fn: Callable taking one channel index
+        channels: Iterable of channel indices
+    """
+    if _CHAN_WORKERS <= 1:
+        for c in channels:
+            fn(c)
+        return
     
-    # Must copy since numpy array may be garbage collected
-    return img.copy()
+    for future in [_CHAN_POOL.submit(fn, c) for c in channels]:
+        future.result()
 
 
 def unpremultiply_alpha(arr: np.ndarray) -> np.ndarray:
@@ -122,26 +404,23 @@ def premultiply_alpha(arr: np.ndarray) -> np.ndarray:
     return np.clip(result, 0, 255).astype(np.uint8)
 
 
+def _alpha8_view(img: QImage, writable: bool = False) -> np.ndarray:
+    """Zero-copy (height, width) view of an Alpha8 image, skipping row padding."""
+    ptr = img.bits() if writable else img.constBits()
+    if hasattr(ptr, 'setsize'):
+        ptr.setsize(img.sizeInBytes())
+    arr = np.frombuffer(ptr, dtype=np.uint8).reshape((img.height(), img.bytesPerLine()))
+    # Alpha8 scanlines are padded to 32 bits, so odd widths carry trailing bytes
+    return arr[:, :img.width()]
+
+
 def qimage_alpha8_to_numpy(img: QImage) -> np.ndarray:
     """Convert an Alpha8 format image (selection mask) to numpy array."""
     if img.format() != QImage.Format.Format_Alpha8:
         img = img.convertToFormat(QImage.Format.Format_Alpha8)
     
-    width = img.width()
-    height = img.height()
-    bytes_per_line = img.bytesPerLine()
-    
-    # Handle both older (voidptr with setsize) and newer (memoryview) PySide6
-    ptr = img.bits()
-    if hasattr(ptr, 'setsize'):
-        ptr.setsize(img.sizeInBytes())
-        arr = np.frombuffer(ptr, dtype=np.uint8).reshape((height, bytes_per_line))
-    else:
-        arr = np.asarray(ptr, dtype=np.uint8).reshape((height, bytes_per_line))
-    
-    arr = arr[:, :width].copy()
-    
-    return arr
+    # Read through constBits() so a shared mask is not detached just to copy it
+    return _alpha8_view(img).copy()
 
 
 def numpy_to_qimage_alpha8(arr: np.ndarray) -> QImage:
@@ -150,17 +429,17 @@ def numpy_to_qimage_alpha8(arr: np.ndarray) -> QImage:
         arr = np.clip(arr, 0, 255).astype(np.uint8)
     
     height, width = arr.shape
-    arr = np.ascontiguousarray(arr)
-    
-    img = QImage(arr.data, width, height, arr.strides[0], QImage.Format.Format_Alpha8)
-    return img.copy()
+    img = QImage(width, height, QImage.Format.Format_Alpha8)
+    _alpha8_view(img, writable=True)[...] = arr
+    return img
 
 
 def gaussian_blur_np(arr: np.ndarray, sigma: float) -> np.ndarray:
     """
     Apply Gaussian blur using separable convolution.
     
-    This is O(n*r) instead of O(n*r²) for a full 2D convolution.
+    This is O(n*r) instead of O(n*r²) for a full 2D convolution. Borders
+    repeat the edge pixel, so blurring does not fade toward the image edges.
     
     Args:
         arr: Image array shape (H, W, C) or (H, W)
@@ -172,43 +451,218 @@ def gaussian_blur_np(arr: np.ndarray, sigma: float) -> np.ndarray:
     if sigma <= 0:
         return arr.copy()
     
-    # Build 1D Gaussian kernel
+    kernel = _gaussian_kernel(sigma)
+    
+    if arr.size >= _GPU_MIN_ELEMENTS and kernel.size >= _GPU_MIN_KERNEL and _gpu() is not None:
+        return _gaussian_blur_gpu(arr, kernel)
+    
+    if cv2 is not None:
+        # Same kernel through OpenCV's SIMD row and column filters, whose
+        # engine already streams rows through a small ring buffer.
+        # BORDER_REPLICATE is scipy's 'nearest'
+        if arr.dtype == np.uint8:
+            # Bytes in and out: the float intermediates stay in those row
+            # buffers and OpenCV rounds on store, so no full-size float32 copy
+            return cv2.sepFilter2D(arr, -1, kernel, kernel, borderType=cv2.BORDER_REPLICATE)
+        
+        result = arr.astype(np.float32)
+        cv2.sepFilter2D(result, -1, kernel, kernel, dst=result, borderType=cv2.BORDER_REPLICATE)
+        
+        # Round rather than truncate: a flat area sums to e.g. 199.99998 in float32
+        np.rint(result, out=result)
+        np.clip(result, 0, 255, out=result)
+        return result.astype(np.uint8)
+    
+    from scipy.ndimage import correlate1d
+    
+    # Blur in horizontal strips sized to stay cache-resident, so the vertical
+    # pass reads the horizontal pass's output from cache instead of DRAM.
+    # Each strip carries `halo` extra rows either side, which makes its
+    # vertical pass exact; at the true image edges 'nearest' applies as usual
+    height = arr.shape[0]
+    halo = kernel.size // 2
+    row_bytes = arr[0].size * 4
+    # Strips at least 16 halos tall keep the recomputed halo rows under ~12%
+    strip = max(16 * halo, _BLUR_STRIP_BYTES // row_bytes, 1)
+    out = np.empty(arr.shape, dtype=np.uint8)
+    
+    def blur_rows(start, stop):
+        for y0 in range(start, stop, strip):
+            y1 = min(y0 + strip, stop)
+            lo, hi = max(y0 - halo, 0), min(y1 + halo, height)
+            
+            # Horizontal then vertical pass over every channel at once.
+            # correlate1d filters through line buffers, so both run in place
+            tile = arr[lo:hi].astype(np.float32)
+            correlate1d(tile, kernel, axis=1, output=tile, mode='nearest')
+            correlate1d(tile, kernel, axis=0, output=tile, mode='nearest')
+            
+            tile = tile[y0 - lo:y1 - lo]
+            np.rint(tile, out=tile)
+            np.clip(tile, 0, 255, out=tile)
+            out[y0:y1] = tile
+    
+    parallel_rows(blur_rows, height)
+    return out
+
+
+def gaussian_blur_downscaled_np(arr: np.ndarray, sigma: float, factor: int) -> np.ndarray:
+    """
+    Approximate gaussian_blur_np for wide blurs by filtering a reduced copy.
+    
+    The image is area-averaged down by `factor`, blurred there, and enlarged
+    again bilinearly, which is factor² less filtering work. A blur many
+    pixels wide has no fine detail left for the reduction to lose.
+    
+    Args:
+        arr: Image array shape (H, W, C) or (H, W)
+        sigma: Standard deviation of the full-size Gaussian
+        factor: Integer reduction factor
+        
+    Returns:
+        Blurred image array
+    """
+    if factor <= 1:
+        return gaussian_blur_np(arr, sigma)
+    
+    height, width = arr.shape[:2]
+    small_h, small_w = -(-height // factor), -(-width // factor)
+    
+    # Repeat the edge out to whole cells, so every cell is a plain mean
+    pad = [(0, small_h * factor - height), (0, small_w * factor - width)] + [(0, 0)] * (arr.ndim - 2)
+    if pad[0][1] or pad[1][1]:
+        arr = np.pad(arr, pad, mode='edge')
+    
+    # Averaging and bilinear enlargement widen the blur by about a quarter
+    # of a reduced pixel² in variance; take that off the reduced sigma
+    small_sigma = np.sqrt(max((sigma / factor) ** 2 - 0.25, 0.25))
+    
+    if cv2 is not None:
+        small = cv2.resize(arr, (small_w, small_h), interpolation=cv2.INTER_AREA)
+        small = gaussian_blur_np(small, small_sigma)
+        full = cv2.resize(small, (small_w * factor, small_h * factor), interpolation=cv2.INTER_LINEAR)
+        return np.ascontiguousarray(full[:height, :width])
+    
+    # Cell sums as factor² strided adds, several times faster than a
+    # reshape-and-sum over the interleaved axes
+    sums = arr[::factor, ::factor].astype(np.uint32)
+    for dy in range(factor):
+        for dx in range(factor):
+            if dy or dx:
+                sums += arr[dy::factor, dx::factor]
+    area = factor * factor
+    sums += area // 2
+    sums //= area
+    small = gaussian_blur_np(sums.astype(np.uint8), small_sigma)
+    return np.ascontiguousarray(_enlarge_linear(small, factor)[:height, :width])
+
+
+def _enlarge_linear(small: np.ndarray, factor: int) -> np.ndarray:
+    """Bilinear enlargement by an integer factor, sampling at pixel centres like cv2.INTER_LINEAR."""
+    out = small.astype(np.float32)
+    # Rows first, so only the second pass runs at full size
+    for axis in (0, 1):
+        n = out.shape[axis]
+        pos = (np.arange(n * factor) + 0.5) / factor - 0.5
+        np.clip(pos, 0, n - 1, out=pos)
+        lo = pos.astype(np.intp)
+        hi = np.minimum(lo + 1, n - 1)
+        shape = [1] * out.ndim
+        shape[axis] = -1
+        frac = (pos - lo).astype(np.float32).reshape(shape)
+        
+        lower = out.take(lo, axis=axis)
+        upper = out.take(hi, axis=axis)
+        upper -= lower
+        upper *= frac
+        lower += upper
+        out = lower
+    
+    np.rint(out, out=out)
+    return out.astype(np.uint8)
+
+
+def _gaussian_blur_gpu(arr: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """gaussian_blur_np's separable passes on the GPU: one upload, one download."""
+    cupy, cupy_ndimage = _gpu()
+    source = cupy.asarray(arr, dtype=cupy.float32)
+    weights = cupy.asarray(kernel)
+    # GPU filter kernels read neighbours in parallel, so passes never run in place
+    temp = cupy_ndimage.correlate1d(source, weights, axis=1, mode='nearest')
+    result = cupy_ndimage.correlate1d(temp, weights, axis=0, output=source, mode='nearest')
+    cupy.rint(result, out=result)
+    cupy.clip(result, 0, 255, out=result)
+    return cupy.asnumpy(result.astype(cupy.uint8))
+
+
+@lru_cache(maxsize=128)
+def _gaussian_kernel(sigma: float) -> np.ndarray:
+    """Normalized 1D Gaussian covering ±3 sigma. Memoized, so the result is read-only."""
     radius = int(np.ceil(sigma * 3))
     size = radius * 2 + 1
     x = np.arange(size) - radius
     kernel = np.exp(-x**2 / (2 * sigma**2))
     kernel = kernel / kernel.sum()
+    kernel.setflags(write=False)
+    return kernel
+
+
+def sobel_np(gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    3x3 Sobel gradients of a 2D float array as shifted-slice arithmetic.
     
-    # Handle multi-channel images
-    if len(arr.shape) == 3:
-        result = np.zeros_like(arr, dtype=np.float32)
-        for c in range(arr.shape[2]):
-            # Horizontal pass
-            temp = np.apply_along_axis(
-                lambda row: np.convolve(row, kernel, mode='same'),
-                axis=1,
-                arr=arr[:, :, c].astype(np.float32)
-            )
-            # Vertical pass
-            result[:, :, c] = np.apply_along_axis(
-                lambda col: np.convolve(col, kernel, mode='same'),
-                axis=0,
-                arr=temp
-            )
-        return np.clip(result, 0, 255).astype(np.uint8)
-    else:
-        # 2D array (grayscale/mask)
-        temp = np.apply_along_axis(
-            lambda row: np.convolve(row, kernel, mode='same'),
-            axis=1,
-            arr=arr.astype(np.float32)
-        )
-        result = np.apply_along_axis(
-            lambda col: np.convolve(col, kernel, mode='same'),
-            axis=0,
-            arr=temp
-        )
-        return np.clip(result, 0, 255).astype(np.uint8)
+    Matches scipy.ndimage.sobel(gray, axis=1) and (gray, axis=0) with the
+    default 'reflect' border (to within float32 rounding), without the
+    generic N-D correlation machinery.
+    
+    Args:
+        gray: Array shape (H, W), float32
+        
+    Returns:
+        (gx, gy) horizontal and vertical gradients, same shape as `gray`
+    """
+    if cv2 is not None:
+        # cv2's BORDER_REFLECT is scipy's 'reflect'
+        gray = gray.astype(np.float32, copy=False)
+        return (cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3, borderType=cv2.BORDER_REFLECT),
+                cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3, borderType=cv2.BORDER_REFLECT))
+    
+    # A one-pixel 'edge' pad is identical to scipy's 'reflect' border
+    padded = np.pad(gray, 1, mode='edge')
+    
+    # Central difference along one axis, then [1, 2, 1] smoothing along the other
+    diff = padded[:, 2:] - padded[:, :-2]
+    gx = diff[1:-1] * 2
+    gx += diff[:-2]
+    gx += diff[2:]
+    
+    diff = padded[2:] - padded[:-2]
+    gy = diff[:, 1:-1] * 2
+    gy += diff[:, :-2]
+    gy += diff[:, 2:]
+    return gx, gy
+
+
+def sobel_magnitude(gray: np.ndarray) -> np.ndarray:
+    """
+    Sobel gradient magnitude sqrt(gx² + gy²) of a 2D float array.
+    
+    Args:
+        gray: Array shape (H, W), float32
+        
+    Returns:
+        float32 magnitude, same shape as `gray`
+    """
+    gx, gy = sobel_np(gray)
+    if cv2 is not None:
+        return cv2.magnitude(gx, gy)
+    
+    # Square into the gradient buffers instead of allocating temporaries.
+    # np.hypot would avoid the squares too, but its overflow-safe scaling
+    # makes it roughly 3x slower and gradients of 8-bit data cannot overflow
+    magnitude = np.multiply(gx, gx, out=gx)
+    magnitude += np.multiply(gy, gy, out=gy)
+    return np.sqrt(magnitude, out=magnitude)
 
 
 def apply_lut(arr: np.ndarray, lut: np.ndarray, channels: tuple = (0, 1, 2)) -> np.ndarray:
@@ -223,12 +677,67 @@ def apply_lut(arr: np.ndarray, lut: np.ndarray, channels: tuple = (0, 1, 2)) ->
     Returns:
         Modified image array
     """
-    result = arr.copy()
-    for c in channels:
-        result[:, :, c] = lut[arr[:, :, c]]
+    return apply_channel_luts(arr, {c: lut for c in channels})
+
+
+def apply_channel_luts(arr: np.ndarray, luts: dict, out: np.ndarray = None) -> np.ndarray:
+    """
+    Apply a separate lookup table to each channel in one pass.
+    
+    Args:
+        arr: Image array (H, W, 4) BGRA
+        luts: Mapping of channel index (0=B, 1=G, 2=R, 3=A) to a (256,) table.
+              Channels without an entry are left unchanged.
+        out: Optional uint8 array of the same shape to write into (e.g. from get_scratch)
+        
+    Returns:
+        Modified image array
+    """
+    identity = np.arange(256, dtype=np.uint8)
+    if cv2 is not None and arr.ndim == 3 and arr.shape[2] == 4:
+        # One SIMD pass over all four channels; untouched channels get an identity table
+        table = np.stack([luts[c].astype(np.uint8, copy=False) if c in luts else identity
+                          for c in range(4)], axis=-1)
+        return cv2.LUT(arr, table.reshape(256, 1, 4), dst=out)
+    
+    result = np.empty_like(arr) if out is None else out
+    
+    if (arr.ndim == 3 and arr.shape[2] == 4 and arr.dtype == np.uint8
+            and arr.strides[2] == 1 and result.strides[2] == 1
+            and arr.shape[0] * arr.shape[1] >= _PAIR_LUT_MIN_PIXELS):
+        # Read pixels as two little-endian byte pairs (B,G) and (R,A) and map
+        # each pair through one 64K-entry table: two gathers instead of four
+        src, dst = arr.view('<u2'), result.view('<u2')
+        
+        def gather(i):
+            if 2 * i in luts or 2 * i + 1 in luts:
+                table = _pair_lut(luts.get(2 * i, identity), luts.get(2 * i + 1, identity))
+                np.take(table, src[:, :, i], out=dst[:, :, i])
+            else:
+                dst[:, :, i] = src[:, :, i]
+        
+        jobs = (0, 1)
+    else:
+        def gather(c):
+            if c in luts:
+                np.take(luts[c], arr[:, :, c], out=result[:, :, c])
+            else:
+                result[:, :, c] = arr[:, :, c]
+        
+        jobs = range(arr.shape[2])
+    
+    # Each job writes a disjoint slice of `result`
+    parallel_channels(gather, jobs)
     return result
 
 
+def _pair_lut(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Combine two 8-bit tables into one indexed by a little-endian uint16 byte pair."""
+    lo = lo.astype(np.uint8, copy=False).astype(np.uint16)
+    hi = hi.astype(np.uint8, copy=False).astype(np.uint16)
+    return (lo[None, :] | (hi[:, None] << 8)).ravel()
+
+
 def morphological_dilate(mask: np.ndarray, radius: int) -> np.ndarray:
     """
     Dilate a binary/grayscale mask (for selection expansion).
@@ -283,7 +792,10 @@ def morphological_erode(mask: np.ndarray, radius: int) -> np.ndarray:
 
 def box_blur_np(arr: np.ndarray, radius: int) -> np.ndarray:
     """
-    Apply box blur using cumulative sum for O(1) per pixel.
+    Apply box blur using cumulative sums, so the cost is O(1) per pixel at any radius.
+    
+    Each output pixel is the rounded mean of the (2r+1)x(2r+1) window around
+    it, with the edge pixel repeated outward.
     
     Args:
         arr: Image array (H, W, C) or (H, W)
@@ -295,46 +807,143 @@ def box_blur_np(arr: np.ndarray, radius: int) -> np.ndarray:
     if radius <= 0:
         return arr.copy()
     
-    # Use cumsum-based approach for efficiency
-    if len(arr.shape) == 3:
-        result = np.zeros_like(arr, dtype=np.float32)
-        for c in range(arr.shape[2]):
-            result[:, :, c] = _box_blur_2d(arr[:, :, c].astype(np.float32), radius)
-        return np.clip(result, 0, 255).astype(np.uint8)
+    size = 2 * radius + 1
+    if cv2 is not None:
+        # Unnormalized int32 window sums, so both paths round identically below
+        sums = cv2.boxFilter(arr, cv2.CV_32S, (size, size), normalize=False,
+                             borderType=cv2.BORDER_REPLICATE)
     else:
-        result = _box_blur_2d(arr.astype(np.float32), radius)
-        return np.clip(result, 0, 255).astype(np.uint8)
+        sums = _window_sums(_window_sums(arr, radius, axis=1), radius, axis=0)
+    
+    # Exact integer mean, rounded half up (255 * 201² fits in int32)
+    area = size * size
+    sums += area // 2
+    sums //= area
+    return sums.astype(np.uint8)
 
 
-def _box_blur_2d(arr: np.ndarray, radius: int) -> np.ndarray:
-    """Box blur a 2D array using cumulative sums."""
-    height, width = arr.shape
+def _window_sums(arr: np.ndarray, radius: int, axis: int) -> np.ndarray:
+    """Sums of every 2r+1 run along `axis`, edge-repeated, as int32."""
+    # One extra leading pad element makes each window sum a difference of two
+    # prefix sums: csum[i + 2r + 1] - csum[i] covers original i-r .. i+r
+    pad = [(0, 0)] * arr.ndim
+    pad[axis] = (radius + 1, radius)
+    csum = np.cumsum(np.pad(arr, pad, mode='edge'), axis=axis, dtype=np.int32)
+    
+    size = 2 * radius + 1
+    upper = [slice(None)] * arr.ndim
+    lower = [slice(None)] * arr.ndim
+    upper[axis] = slice(size, None)
+    lower[axis] = slice(None, -size)
+    return np.subtract(csum[tuple(upper)], csum[tuple(lower)], out=csum[tuple(upper)])
+
+
+def median_blur_np(arr: np.ndarray, radius: int, out: np.ndarray = None) -> np.ndarray:
+    """
+    Median of each colour channel over the (2r+1)x(2r+1) window around each
+    pixel, with the edge pixel repeated outward. Alpha is copied unchanged.
     
-    # Horizontal pass
-    padded_h = np.pad(arr, ((0, 0), (radius, radius)), mode='edge')
-    cumsum_h = np.cumsum(padded_h, axis=1)
-    temp = (cumsum_h[:, 2*radius:] - cumsum_h[:, :-2*radius]) / (2*radius + 1)
+    Args:
+        arr: Image array (H, W, 4) BGRA
+        radius: Window radius
+        out: Optional uint8 array of the same shape to write into (e.g. a
+             writable qimage_view); must not overlap `arr`
+        
+    Returns:
+        Filtered image array
+    """
+    window_size = 2 * radius + 1
+    
+    if cv2 is not None:
+        # Borders replicate. 3x3 and 5x5 use sorting networks that run
+        # all four packed channels at once, so alpha there costs nothing;
+        # above that each channel gets its own histogram pass, so only
+        # the colour planes are filtered
+        if window_size <= 5:
+            result = cv2.medianBlur(arr, window_size, dst=out)
+        else:
+            result = np.empty_like(arr) if out is None else out
+            result[:, :, :3] = cv2.medianBlur(np.ascontiguousarray(arr[:, :, :3]), window_size)
+        result[:, :, 3] = arr[:, :, 3]
+        return result
+    
+    from scipy.ndimage import median_filter
+    
+    # Every colour plane is written below, so only alpha is copied
+    result = np.empty_like(arr) if out is None else out
+    result[:, :, 3] = arr[:, :, 3]
+    
+    # Selection-based median in C: no (H, W, k²) neighborhood array and
+    # no full sort per pixel. 'nearest' repeats the edge like the old pad.
+    # Both filters release the GIL, so the colour planes run in parallel
+    def filter_channel(c):
+        if radius == 1:
+            # The default radius has a much faster fixed selection network
+            padded = np.empty((arr.shape[0] + 2, arr.shape[1] + 2), dtype=np.uint8)
+            _median_3x3(arr[:, :, c], result[:, :, c], padded)
+        else:
+            median_filter(arr[:, :, c], size=window_size, output=result[:, :, c], mode='nearest')
+    
+    parallel_channels(filter_channel, range(3))  # Process RGB, skip alpha
+    return result
+
+
+def _median3(a: np.ndarray, b: np.ndarray, c: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """Element-wise median of three arrays."""
+    return np.maximum(np.minimum(a, b), np.minimum(np.maximum(a, b), c), out=out)
+
+
+def _median_3x3(plane: np.ndarray, out: np.ndarray, padded: np.ndarray):
+    """
+    3x3 median of a 2D uint8 plane with edge-repeat borders, into `out`.
     
-    # Vertical pass  
-    padded_v = np.pad(temp, ((radius, radius), (0, 0)), mode='edge')
-    cumsum_v = np.cumsum(padded_v, axis=0)
-    result = (cumsum_v[2*radius:, :] - cumsum_v[:-2*radius, :]) / (2*radius + 1)
+    A min/max selection network over whole planes: sort every vertical
+    triple once, then each window's median is the median of the largest
+    "low", the median "middle" and the smallest "high" of its three columns.
+    Neighbouring windows share the column sorts, so this is ~18 element-wise
+    passes in total, with no per-window selection.
     
-    return result
+    `padded` is a (H + 2, W + 2) scratch buffer.
+    """
+    padded[1:-1, 1:-1] = plane
+    padded[0, 1:-1] = plane[0]
+    padded[-1, 1:-1] = plane[-1]
+    padded[:, 0] = padded[:, 1]
+    padded[:, -1] = padded[:, -2]
+    top, center, bottom = padded[:-2], padded[1:-1], padded[2:]
+    
+    # Sort each vertical triple into low <= mid <= high
+    low, high = np.minimum(top, center), np.maximum(top, center)
+    mid, high = np.minimum(high, bottom), np.maximum(high, bottom)
+    low, mid = np.minimum(low, mid), np.maximum(low, mid)
+    
+    left, right = slice(None, -2), slice(2, None)
+    lows = np.maximum(np.maximum(low[:, left], low[:, 1:-1]), low[:, right])
+    highs = np.minimum(np.minimum(high[:, left], high[:, 1:-1]), high[:, right])
+    mids = _median3(mid[:, left], mid[:, 1:-1], mid[:, right])
+    _median3(lows, mids, highs, out=out)
 
 
 def sepia_transform(arr: np.ndarray) -> np.ndarray:
-    """Apply sepia tone transformation."""
-    # BGRA format, extract channels
-    b, g, r = arr[:, :, 0].astype(np.float32), arr[:, :, 1].astype(np.float32), arr[:, :, 2].astype(np.float32)
+    """Apply sepia tone transformation. Alpha passes through unchanged."""
+    if cv2 is not None:
+        # One SIMD pass per pixel; the last matrix row copies alpha exactly
+        return cv2.transform(arr, _SEPIA_BGRA)
     
-    new_r = r * 0.393 + g * 0.769 + b * 0.189
-    new_g = r * 0.349 + g * 0.686 + b * 0.168
-    new_b = r * 0.272 + g * 0.534 + b * 0.131
+    # BGRA format: mix the colour planes only and copy alpha across
+    b, g, r = arr[:, :, 0].astype(np.float32), arr[:, :, 1].astype(np.float32), arr[:, :, 2].astype(np.float32)
     
-    result = arr.copy()
-    result[:, :, 0] = np.clip(new_b, 0, 255)
-    result[:, :, 1] = np.clip(new_g, 0, 255)
-    result[:, :, 2] = np.clip(new_r, 0, 255)
+    result = np.empty_like(arr)
+    result[:, :, 3] = arr[:, :, 3]
+    mixed = np.empty_like(b)
+    for c, (wb, wg, wr, _) in enumerate(_SEPIA_BGRA[:3]):
+        np.multiply(b, wb, out=mixed)
+        mixed += g * wg
+        mixed += r * wr
+        # Round like OpenCV's saturating cast; the weights are all positive
+        mixed += 0.5
+        np.minimum(mixed, 255, out=mixed)
+        result[:, :, c] = mixed
     
-    return result.astype(np.uint8)
+    return result
+
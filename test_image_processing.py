@@ -8,21 +8,33 @@ Tests the "don't get wrecked" checklist:
 """
 import sys
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 import numpy as np
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QImage, QColor
 
 from src.utils.image_processing import (
-    qimage_to_numpy, numpy_to_qimage,
+    qimage_to_numpy, numpy_to_qimage, qimage_view, to_planes, gather_pixels, remap_bilinear,
     qimage_alpha8_to_numpy, numpy_to_qimage_alpha8,
     premultiply_alpha, unpremultiply_alpha,
-    gaussian_blur_np, morphological_dilate, morphological_erode
+    gaussian_blur_np, gaussian_blur_downscaled_np, box_blur_np, median_blur_np, morphological_dilate, morphological_erode, sobel_np,
+    parallel_rows, parallel_channels
 )
+import src.utils.image_processing as image_processing
 
 # Init App
 app = QApplication.instance() or QApplication(sys.argv)
 
 
+def fake_gpu():
+    """Stand-in for image_processing._gpu(): the CuPy calls the GPU paths use, on NumPy and SciPy."""
+    from scipy import ndimage
+    cupy = SimpleNamespace(asarray=np.asarray, asnumpy=np.asarray, empty=np.empty,
+                           rint=np.rint, clip=np.clip, float32=np.float32, uint8=np.uint8)
+    return cupy, ndimage
+
+
 class TestQImageNumPyRoundTrip(unittest.TestCase):
     """Test QImage ↔ NumPy conversions preserve pixel data."""
     
@@ -72,6 +84,111 @@ class TestQImageNumPyRoundTrip(unittest.TestCase):
         # Check center pixel
         self.assertEqual(result.pixelColor(5, 5).alpha(), 200)
         self.assertEqual(result.pixelColor(0, 0).alpha(), 0)
+    
+    def test_alpha8_odd_width_stride(self):
+        """Alpha8 rows padded past the width should not leak into the array."""
+        arr = np.arange(7 * 13, dtype=np.uint8).reshape(7, 13)
+        
+        img = numpy_to_qimage_alpha8(arr)
+        self.assertGreater(img.bytesPerLine(), img.width())
+        
+        for y, x in ((0, 12), (6, 0), (3, 7)):
+            self.assertEqual(img.pixelColor(x, y).alpha(), arr[y, x])
+        np.testing.assert_array_equal(qimage_alpha8_to_numpy(img), arr)
+    
+    def test_view_matches_copy(self):
+        """Read-only view should see the same pixels as qimage_to_numpy."""
+        img = QImage(7, 5, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(10, 20, 30, 255))
+        img.setPixelColor(6, 4, QColor(200, 100, 50, 255))
+        
+        view = qimage_view(img)
+        
+        self.assertFalse(view.flags.writeable)
+        np.testing.assert_array_equal(view, qimage_to_numpy(img))
+    
+    def test_view_pins_other_formats_to_bgra(self):
+        """Non-32-bit formats should come back as premultiplied BGRA copies."""
+        img = QImage(6, 3, QImage.Format.Format_RGBA8888)
+        img.fill(QColor(10, 20, 30, 255))
+        img.setPixelColor(5, 2, QColor(200, 100, 50, 255))
+        
+        arr = qimage_view(img)
+        
+        self.assertEqual(arr.shape, (3, 6, 4))
+        np.testing.assert_array_equal(arr[0, 0], [30, 20, 10, 255])
+        np.testing.assert_array_equal(arr[2, 5], [50, 100, 200, 255])
+        with self.assertRaises(ValueError):
+            qimage_view(img, writable=True)
+    
+    def test_writable_view_modifies_image(self):
+        """Writes through a writable view should land in the QImage."""
+        img = QImage(3, 3, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(0, 0, 0, 255))
+        
+        view = qimage_view(img, writable=True)
+        view[1, 2] = (255, 0, 0, 255)  # BGRA: blue
+        
+        self.assertEqual(img.pixelColor(2, 1), QColor(0, 0, 255, 255))
+    
+    def test_planes_deinterleave_channels(self):
+        """to_planes should return contiguous B, G, R planes."""
+        arr = np.arange(5 * 4 * 4, dtype=np.uint8).reshape(5, 4, 4)
+        
+        planes = to_planes(arr)
+        
+        self.assertEqual(planes.shape, (3, 5, 4))
+        self.assertTrue(planes.flags.c_contiguous)
+        for c in range(3):
+            np.testing.assert_array_equal(planes[c], arr[:, :, c])
+    
+    def test_gather_matches_fancy_indexing(self):
+        """gather_pixels should equal arr[sy, sx], also for padded views."""
+        rng = np.random.default_rng(2)
+        arr = rng.integers(0, 256, (7, 9, 4), dtype=np.uint8)
+        sy = rng.integers(0, 7, (5, 6)).astype(np.int32)
+        sx = rng.integers(0, 9, (5, 6)).astype(np.int32)
+        
+        np.testing.assert_array_equal(gather_pixels(arr, sy, sx), arr[sy, sx])
+        
+        img = numpy_to_qimage(arr)
+        view = qimage_view(img)
+        np.testing.assert_array_equal(gather_pixels(view, sy, sx), arr[sy, sx])
+
+    
+    def test_bilinear_remap_interpolates_and_clamps(self):
+        """Both backends: identity is exact, half steps average, edges repeat."""
+        arr = np.random.default_rng(3).integers(0, 256, (6, 8, 4), dtype=np.uint8)
+        ys = np.arange(6, dtype=np.float32)[:, None]
+        xs = np.arange(8, dtype=np.float32)
+        
+        for backend in (image_processing.cv2, None):
+            with mock.patch.object(image_processing, "cv2", backend):
+                np.testing.assert_array_equal(remap_bilinear(arr, xs, ys), arr)
+                
+                half = remap_bilinear(arr, xs[:-1] + 0.5, ys).astype(int)
+                mean = (arr[:, :-1].astype(int) + arr[:, 1:]) / 2
+                self.assertLessEqual(np.abs(half - mean).max(), 1)
+                
+                outside = remap_bilinear(arr, xs - 3, ys + 10)
+                np.testing.assert_array_equal(outside[:, :3], np.broadcast_to(arr[5, :1], (6, 3, 4)))
+    
+    def test_bilinear_remap_gpu_matches_numpy(self):
+        """The CuPy branch samples like the NumPy gathers, edges included."""
+        rng = np.random.default_rng(5)
+        arr = rng.integers(0, 256, (20, 30, 4), dtype=np.uint8)
+        map_x = rng.uniform(-3, 33, (16, 24)).astype(np.float32)
+        map_y = rng.uniform(-3, 23, (16, 24)).astype(np.float32)
+        
+        with mock.patch.object(image_processing, "cv2", None):
+            expected = remap_bilinear(arr, map_x, map_y)
+            with mock.patch.multiple(image_processing, _gpu=fake_gpu, _GPU_MIN_ELEMENTS=0), \
+                    mock.patch.object(image_processing, "_remap_bilinear_gpu",
+                                      wraps=image_processing._remap_bilinear_gpu) as gpu_remap:
+                result = remap_bilinear(arr, map_x, map_y)
+        
+        gpu_remap.assert_called_once()
+        np.testing.assert_array_equal(result, expected)
 
 
 class TestPremultiplyAlpha(unittest.TestCase):
@@ -177,6 +294,56 @@ class TestGaussianBlur(unittest.TestCase):
         self.assertGreater(blurred[5, 4, 0], 0)
         self.assertGreater(blurred[4, 5, 0], 0)
     
+    def test_blur_keeps_flat_image_flat(self):
+        """Edges repeat outward, so a flat image should not darken at the border."""
+        for value in (77, 200, 255):
+            arr = np.full((8, 9, 4), value, dtype=np.uint8)
+            
+            blurred = gaussian_blur_np(arr, sigma=2.0)
+            
+            np.testing.assert_array_equal(blurred, arr)
+    
+    def test_kernel_is_cached_and_normalized(self):
+        """Repeated blurs at one sigma should reuse a single read-only kernel."""
+        kernel = image_processing._gaussian_kernel(1.5)
+        
+        self.assertIs(image_processing._gaussian_kernel(1.5), kernel)
+        self.assertFalse(kernel.flags.writeable)
+        self.assertEqual(kernel.size, 2 * 5 + 1)  # ceil(3 * sigma) either side
+        self.assertAlmostEqual(kernel.sum(), 1.0)
+    
+    def test_blur_strips_match_single_pass(self):
+        """Strip halos should make the tiled NumPy path exact at every seam."""
+        arr = np.random.default_rng(2).integers(0, 256, (110, 17, 4), dtype=np.uint8)
+        
+        # sigma 0.7 has a 3-row halo, so the smallest strip is 48 rows: 3 strips
+        with mock.patch.object(image_processing, "cv2", None):
+            whole = gaussian_blur_np(arr, sigma=0.7)
+            with mock.patch.object(image_processing, "_BLUR_STRIP_BYTES", 1):
+                tiled = gaussian_blur_np(arr, sigma=0.7)
+        
+        np.testing.assert_array_equal(tiled, whole)
+    
+    def test_downscaled_blur_tracks_full_blur(self):
+        """The reduced-copy blur should stay close to the exact one, on both backends."""
+        yy, xx = np.mgrid[0:101, 0:130]  # Not a multiple of the factor
+        arr = np.empty((101, 130, 4), dtype=np.uint8)
+        arr[:, :, 0] = np.where((xx // 20 + yy // 20) % 2, 220, 30)
+        arr[:, :, 1] = 128 + 100 * np.sin(xx / 9.0)
+        arr[:, :, 2] = yy * 2
+        arr[:, :, 3] = 255
+        exact = gaussian_blur_np(arr, sigma=6.0)
+        
+        for backend in (image_processing.cv2, None):
+            with mock.patch.object(image_processing, "cv2", backend):
+                approx = gaussian_blur_downscaled_np(arr, sigma=6.0, factor=2)
+            
+            self.assertEqual(approx.shape, arr.shape)
+            diff = np.abs(approx.astype(int) - exact)
+            self.assertLessEqual(diff.max(), 6)
+            self.assertLess(diff.mean(), 1.0)
+            np.testing.assert_array_equal(approx[:, :, 3], 255)
+    
     def test_blur_sigma_zero_unchanged(self):
         """Sigma=0 should return unchanged image."""
         arr = np.array([[[100, 150, 200, 255]]], dtype=np.uint8)
@@ -185,6 +352,240 @@ class TestGaussianBlur(unittest.TestCase):
         
         np.testing.assert_array_equal(blurred, arr)
 
+    def test_small_images_never_probe_the_gpu(self):
+        """CuPy is only imported once an image is big enough to use it."""
+        arr = np.full((32, 32, 4), 200, dtype=np.uint8)
+        with mock.patch.object(image_processing, "_gpu") as gpu:
+            gaussian_blur_np(arr, sigma=20)
+            remap_bilinear(arr, np.zeros((32, 32)), np.zeros((32, 32)))
+        gpu.assert_not_called()
+    
+    def test_gpu_blur_matches_cpu(self):
+        """The CuPy branch blurs like the CPU path: same kernel, edges and rounding."""
+        arr = np.random.default_rng(6).integers(0, 256, (40, 50, 4), dtype=np.uint8)
+        
+        with mock.patch.object(image_processing, "cv2", None):
+            expected = gaussian_blur_np(arr, sigma=6.0)
+        with mock.patch.multiple(image_processing, _gpu=fake_gpu, _GPU_MIN_ELEMENTS=0), \
+                mock.patch.object(image_processing, "_gaussian_blur_gpu",
+                                  wraps=image_processing._gaussian_blur_gpu) as gpu_blur:
+            result = gaussian_blur_np(arr, sigma=6.0)
+        
+        gpu_blur.assert_called_once()
+        self.assertEqual(result.dtype, np.uint8)
+        np.testing.assert_array_equal(result, expected)
+    
+    def test_gpu_probe_threshold_and_cpu_fallback(self):
+        """Only blurs and remaps at the size thresholds probe for CuPy; with no GPU they stay on the CPU."""
+        rng = np.random.default_rng(7)
+        arr = rng.integers(0, 256, (20, 25, 4), dtype=np.uint8)
+        # One sample per pixel, so the remap's output is as large as arr
+        map_x = rng.uniform(0, 24, (20, 25)).astype(np.float32)
+        map_y = rng.uniform(0, 19, (20, 25)).astype(np.float32)
+        
+        with mock.patch.object(image_processing, "cv2", None):
+            blurred = gaussian_blur_np(arr, sigma=20)
+            remapped = remap_bilinear(arr, map_x, map_y)
+            
+            # One element short of the threshold, or a narrow kernel: no probe
+            with mock.patch.object(image_processing, "_GPU_MIN_ELEMENTS", arr.size + 1), \
+                    mock.patch.object(image_processing, "_gpu") as gpu:
+                gaussian_blur_np(arr, sigma=20)
+                remap_bilinear(arr, map_x, map_y)
+            gpu.assert_not_called()
+            with mock.patch.object(image_processing, "_GPU_MIN_ELEMENTS", arr.size), \
+                    mock.patch.object(image_processing, "_gpu") as gpu:
+                gaussian_blur_np(arr, sigma=1)
+            gpu.assert_not_called()
+            
+            # At the threshold both probe once; with no GPU they match the CPU path
+            with mock.patch.object(image_processing, "_GPU_MIN_ELEMENTS", arr.size), \
+                    mock.patch.object(image_processing, "_gpu", return_value=None) as gpu:
+                np.testing.assert_array_equal(gaussian_blur_np(arr, sigma=20), blurred)
+                np.testing.assert_array_equal(remap_bilinear(arr, map_x, map_y), remapped)
+            self.assertEqual(gpu.call_count, 2)
+
+
+class TestBoxBlur(unittest.TestCase):
+    """Test rolling-sum box blur."""
+    
+    def test_flat_image_unchanged(self):
+        """The window covers 2r+1 pixels each way, so flat areas keep their value."""
+        arr = np.full((12, 15, 4), 200, dtype=np.uint8)
+        
+        for backend in (image_processing.cv2, None):
+            with mock.patch.object(image_processing, "cv2", backend):
+                np.testing.assert_array_equal(box_blur_np(arr, 3), arr)
+    
+    def test_matches_brute_force_mean(self):
+        """Both backends should give the rounded mean of the clamped window."""
+        arr = np.random.default_rng(3).integers(0, 256, (20, 23, 4), dtype=np.uint8)
+        radius = 2
+        padded = np.pad(arr.astype(np.int64), ((radius, radius), (radius, radius), (0, 0)), mode='edge')
+        size = 2 * radius + 1
+        total = sum(padded[dy:dy + 20, dx:dx + 23]
+                    for dy in range(size) for dx in range(size))
+        expected = ((total + size * size // 2) // (size * size)).astype(np.uint8)
+        
+        for backend in (image_processing.cv2, None):
+            with mock.patch.object(image_processing, "cv2", backend):
+                np.testing.assert_array_equal(box_blur_np(arr, radius), expected)
+
+
+class TestMedianBlur(unittest.TestCase):
+    """Test the shared median filter behind Median and Reduce Noise."""
+    
+    def test_backends_match_scipy(self):
+        """Every path (networks, histogram, selection) should give the exact median."""
+        from scipy.ndimage import median_filter
+        
+        arr = np.random.default_rng(6).integers(0, 256, (24, 27, 4), dtype=np.uint8)
+        
+        for radius in (1, 2, 4):
+            expected = median_filter(arr, size=(2 * radius + 1, 2 * radius + 1, 1), mode='nearest')
+            expected[:, :, 3] = arr[:, :, 3]
+            for backend in (image_processing.cv2, None):
+                with mock.patch.object(image_processing, "cv2", backend):
+                    np.testing.assert_array_equal(median_blur_np(arr, radius), expected,
+                                                  err_msg=f"radius {radius}, cv2 {backend is not None}")
+    
+    def test_writes_into_qimage_view(self):
+        """out= fills a writable view of the destination image in place."""
+        arr = np.random.default_rng(16).integers(0, 256, (20, 23, 4), dtype=np.uint8)
+        
+        for radius in (1, 3):
+            for backend in (image_processing.cv2, None):
+                with mock.patch.object(image_processing, "cv2", backend):
+                    expected = median_blur_np(arr, radius)
+                    dest = QImage(23, 20, QImage.Format.Format_ARGB32_Premultiplied)
+                    median_blur_np(arr, radius, out=qimage_view(dest, writable=True))
+                np.testing.assert_array_equal(qimage_to_numpy(dest), expected)
+
+
+class TestSobel(unittest.TestCase):
+    """Test the slice-based Sobel gradients."""
+    
+    def test_matches_scipy(self):
+        """Gradients should match scipy.ndimage.sobel, borders included."""
+        from scipy.ndimage import sobel
+        
+        gray = np.random.default_rng(0).random((9, 13), dtype=np.float32) * 255
+        
+        gx, gy = sobel_np(gray)
+        
+        np.testing.assert_allclose(gx, sobel(gray, axis=1), atol=1e-3)
+        np.testing.assert_allclose(gy, sobel(gray, axis=0), atol=1e-3)
+
+
+class TestParallelRows(unittest.TestCase):
+    """Test row banding, forcing several bands even on a single-core host."""
+    
+    def setUp(self):
+        patcher = mock.patch.multiple(image_processing, _ROW_WORKERS=4, _BAND_MIN_ROWS=8)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_bands_cover_every_row_once(self):
+        hits = np.zeros(50, dtype=int)
+        bands = []
+        
+        def fn(start, stop):
+            hits[start:stop] += 1
+            bands.append((start, stop))
+        
+        parallel_rows(fn, 50)
+        
+        self.assertEqual(len(bands), 4)
+        np.testing.assert_array_equal(hits, 1)
+    
+    def test_max_rows_splits_bands_into_strips(self):
+        hits = np.zeros(50, dtype=int)
+        strips = []
+        
+        def fn(start, stop):
+            hits[start:stop] += 1
+            strips.append((start, stop))
+        
+        parallel_rows(fn, 50, max_rows=5)
+        
+        self.assertTrue(all(0 < stop - start <= 5 for start, stop in strips))
+        self.assertGreater(len(strips), 10)  # Ragged band ends add short strips
+        np.testing.assert_array_equal(hits, 1)
+    
+    def test_pencil_sketch_seams_match_single_band(self):
+        """The Sobel halo rows should make banded output identical to one pass."""
+        from src.effects.artistic import PencilSketchEffect
+        
+        rng = np.random.default_rng(1)
+        arr = rng.integers(0, 256, (40, 23, 4), dtype=np.uint8)
+        arr[:, :, 3] = 255
+        img = numpy_to_qimage(arr)
+        
+        banded = qimage_to_numpy(PencilSketchEffect().apply(img, {"detail": 7}))
+        with mock.patch.object(image_processing, "_ROW_WORKERS", 1):
+            whole = qimage_to_numpy(PencilSketchEffect().apply(img, {"detail": 7}))
+        
+        np.testing.assert_array_equal(banded, whole)
+    
+    def test_stencil_effects_seams_match_single_band(self):
+        """Emboss and Edge Detect bands should also reproduce one pass exactly."""
+        from src.effects.distort import EmbossEffect, EdgeDetectEffect
+        
+        arr = np.random.default_rng(4).integers(0, 256, (41, 19, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        
+        for effect in (EmbossEffect(), EdgeDetectEffect()):
+            banded = qimage_to_numpy(effect.apply(img, {}))
+            with mock.patch.object(image_processing, "_ROW_WORKERS", 1):
+                whole = qimage_to_numpy(effect.apply(img, {}))
+            
+            np.testing.assert_array_equal(banded, whole, err_msg=effect.name)
+    
+    def test_warp_bands_match_single_pass(self):
+        """Per-band coordinate maps should reproduce the whole-image warp."""
+        from src.effects.distort import BulgeEffect, TwistEffect, DentsEffect
+        
+        arr = np.random.default_rng(5).integers(0, 256, (37, 29, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        
+        for effect in (BulgeEffect(), TwistEffect(), DentsEffect()):
+            for quality in ("fast", "high"):
+                banded = qimage_to_numpy(effect.apply(img, {"quality": quality}))
+                with mock.patch.object(image_processing, "_ROW_WORKERS", 1):
+                    whole = qimage_to_numpy(effect.apply(img, {"quality": quality}))
+                
+                np.testing.assert_array_equal(banded, whole, err_msg=f"{effect.name} {quality}")
+
+
+class TestParallelChannels(unittest.TestCase):
+    """Test channel fan-out, forcing the pool even on a single-core host."""
+    
+    def setUp(self):
+        patcher = mock.patch.object(image_processing, "_CHAN_WORKERS", 3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_each_channel_runs_once(self):
+        calls = []
+        
+        parallel_channels(calls.append, range(3))
+        
+        self.assertEqual(sorted(calls), [0, 1, 2])
+    
+    def test_median_channels_match_serial(self):
+        from src.effects.blurs import MedianEffect
+        
+        arr = np.random.default_rng(5).integers(0, 256, (30, 26, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        
+        for radius in (1, 2):
+            with mock.patch.object(image_processing, "cv2", None):
+                pooled = qimage_to_numpy(MedianEffect().apply(img, {"radius": radius}))
+                with mock.patch.object(image_processing, "_CHAN_WORKERS", 1):
+                    serial = qimage_to_numpy(MedianEffect().apply(img, {"radius": radius}))
+            
+            np.testing.assert_array_equal(pooled, serial)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,26 @@
+import math
 import sys
 import unittest
+from unittest import mock
+import numpy as np
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QColor, QImage
+from PySide6.QtTest import QTest
 from src.core.effects import EffectRegistry
-from src.effects import register_all_effects
-from src.effects.adjustments import InvertEffect, AutoLevelEffect, HueSaturationEffect
+from src.effects import register_all_effects, adjustments, distort
+from src.effects.adjustments import (InvertEffect, AutoLevelEffect, HueSaturationEffect,
+                                     BrightnessContrastEffect, InvertAlphaEffect,
+                                     ColorBalanceEffect)
+from src.effects.artistic import CrystallizeEffect, InkSketchEffect, PencilSketchEffect
+from src.effects.blurs import (MotionBlurEffect, MedianEffect, SepiaEffect, SharpenEffect,
+                               GaussianBlurEffect, UnfocusEffect)
+from src.effects.stylize import DropShadowEffect, BokehBlurEffect
+from src.effects.distort import (PixelateEffect, EmbossEffect, EdgeDetectEffect, ReduceNoiseEffect,
+                                 RadialBlurEffect, ZoomBlurEffect, BulgeEffect, TwistEffect,
+                                 DentsEffect, AddNoiseEffect, FrostedGlassEffect, Rotate3DEffect,
+                                 PolarInversionEffect)
+from src.utils import image_processing
+from src.utils.image_processing import numpy_to_qimage, qimage_to_numpy, gaussian_blur_np, remap_bilinear
 
 # Init App
 app = QApplication.instance() or QApplication(sys.argv)
@@ -23,6 +39,29 @@ class TestPhase5(unittest.TestCase):
         self.assertIn("Hue / Saturation", names)
         self.assertIn("Auto Level", names)
         
+    def test_registry_has_no_duplicates(self):
+        # A second definition of an effect (e.g. a leftover slow copy) would
+        # show up as a repeated menu name or a repeated class name
+        register_all_effects()
+        classes = [e for effect_list in EffectRegistry.get_all().values() for e in effect_list]
+        for attr in ("__name__", "name"):
+            values = [getattr(e, attr) for e in classes]
+            duplicates = {v for v in values if values.count(v) > 1}
+            self.assertFalse(duplicates, f"duplicate effect {attr}: {duplicates}")
+        
+    def test_effect_modules_define_each_class_once(self):
+        # A later redefinition in the same module silently replaces the
+        # earlier class at import time, so the registry alone cannot see it
+        import ast
+        import importlib
+        import inspect
+        for name in ("adjustments", "artistic", "blurs", "distort", "photo", "render", "stylize"):
+            module = importlib.import_module(f"src.effects.{name}")
+            tree = ast.parse(inspect.getsource(module))
+            classes = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+            duplicates = {c for c in classes if classes.count(c) > 1}
+            self.assertFalse(duplicates, f"{name}.py redefines {duplicates}")
+        
     def test_invert_effect(self):
         img = QImage(2, 2, QImage.Format.Format_ARGB32_Premultiplied)
         img.fill(QColor(255, 0, 0)) # Red
@@ -36,6 +75,127 @@ class TestPhase5(unittest.TestCase):
         self.assertEqual(c.green(), 255)
         self.assertEqual(c.blue(), 255)
         
+    def test_invert_alpha(self):
+        img = QImage(2, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        img.setPixelColor(0, 0, QColor(10, 20, 30, 255))
+        img.setPixelColor(1, 0, QColor(0, 0, 0, 0))
+        
+        new_img = InvertAlphaEffect().apply(img, {})
+        
+        self.assertEqual(new_img.pixelColor(0, 0).alpha(), 0)
+        # Transparent black becomes opaque black; color bytes are untouched
+        c = new_img.pixelColor(1, 0)
+        self.assertEqual((c.red(), c.green(), c.blue(), c.alpha()), (0, 0, 0, 255))
+        # Input is left as it was
+        self.assertEqual(img.pixelColor(0, 0).alpha(), 255)
+        
+    def test_brightness_contrast(self):
+        img = QImage(3, 2, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(100, 100, 100))
+        img.setPixelColor(2, 1, QColor(250, 20, 128))
+        
+        effect = BrightnessContrastEffect()
+        new_img = effect.apply(img, {"brightness": 50, "contrast": 0})
+        
+        # Contrast 0 is an identity factor, so brightness is a plain offset
+        c = new_img.pixelColor(0, 0)
+        self.assertEqual((c.red(), c.green(), c.blue(), c.alpha()), (150, 150, 150, 255))
+        # Clipped at 255
+        c = new_img.pixelColor(2, 1)
+        self.assertEqual((c.red(), c.green(), c.blue()), (255, 70, 178))
+        
+    def test_brightness_contrast_extremes(self):
+        img = QImage(3, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        for x, v in enumerate((100, 128, 160)):
+            img.setPixelColor(x, 0, QColor(v, v, v))
+        
+        effect = BrightnessContrastEffect()
+        cases = [
+            # Contrast 100 is clamped to 99 to keep the factor finite
+            ({"brightness": 0, "contrast": 100}, [65, 128, 199]),
+            ({"brightness": 0, "contrast": -100}, [115, 128, 142]),
+            ({"brightness": -10, "contrast": 50}, [76, 118, 165]),
+        ]
+        for config, expected in cases:
+            new_img = effect.apply(img, config)
+            self.assertEqual([new_img.pixelColor(x, 0).red() for x in range(3)], expected)
+        
+    def test_dialog_preview_uses_scaled_proxy(self):
+        img = QImage(1600, 800, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(100, 100, 100))
+        
+        effect = BrightnessContrastEffect()
+        dlg = effect.create_dialog(None)
+        previews = []
+        dlg.preview_changed.connect(previews.append)
+        
+        dlg.set_preview_source(img, effect)
+        dlg.b_slider.setValue(50)
+        QTest.qWait(adjustments._PREVIEW_DEBOUNCE_MS * 4)
+        
+        self.assertEqual(len(previews), 2)
+        self.assertEqual((previews[-1].width(), previews[-1].height()), (384, 192))
+        self.assertEqual(previews[-1].pixelColor(0, 0).red(), 150)
+        # The source itself is never touched by previews
+        self.assertEqual(img.pixelColor(0, 0).red(), 100)
+        
+    def test_dialog_preview_waits_for_sliders_to_settle(self):
+        img = QImage(8, 4, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(100, 100, 100))
+        
+        effect = ColorBalanceEffect()
+        dlg = effect.create_dialog(None)
+        previews = []
+        dlg.preview_changed.connect(previews.append)
+        dlg.set_preview_source(img, effect)
+        
+        # A drag across several values renders nothing until it pauses...
+        for value in (10, 20, 30):
+            dlg.cr_slider.setValue(value)
+        self.assertEqual(len(previews), 1)
+        
+        # ...and then renders the final settings once
+        QTest.qWait(adjustments._PREVIEW_DEBOUNCE_MS * 4)
+        self.assertEqual(len(previews), 2)
+        expected = effect.apply(img, {"cyan_red": 30, "magenta_green": 0, "yellow_blue": 0})
+        self.assertEqual(previews[-1].pixelColor(0, 0), expected.pixelColor(0, 0))
+        
+        # Closing the dialog drops a refresh that is still pending
+        dlg.cr_slider.setValue(40)
+        dlg.reject()
+        QTest.qWait(adjustments._PREVIEW_DEBOUNCE_MS * 4)
+        self.assertEqual(len(previews), 2)
+        
+    def test_color_balance(self):
+        img = QImage(2, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        img.setPixelColor(0, 0, QColor(100, 100, 100))
+        img.setPixelColor(1, 0, QColor(250, 30, 5))
+        
+        effect = ColorBalanceEffect()
+        new_img = effect.apply(img, {"cyan_red": 20, "magenta_green": -30, "yellow_blue": 0})
+        
+        # +51 red, -76 green (int(x * 2.55)), blue untouched, clamped to 0-255
+        c = new_img.pixelColor(0, 0)
+        self.assertEqual((c.red(), c.green(), c.blue()), (151, 24, 100))
+        c = new_img.pixelColor(1, 0)
+        self.assertEqual((c.red(), c.green(), c.blue()), (255, 0, 5))
+        
+    def test_identity_adjustments_return_input(self):
+        img = QImage(2, 2, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(10, 20, 30))
+        
+        cases = [
+            (BrightnessContrastEffect(), {"brightness": 0, "contrast": 0}),
+            (HueSaturationEffect(), {"hue": 0, "saturation": 0}),
+            (ColorBalanceEffect(), {"cyan_red": 0, "magenta_green": 0, "yellow_blue": 0}),
+            # Offsets that round to zero are a no-op too
+            (ColorBalanceEffect(), {"cyan_red": 0.2}),
+            # Every channel is flat, so there is nothing to stretch
+            (AutoLevelEffect(), {}),
+        ]
+        for effect, config in cases:
+            self.assertIs(effect.apply(img, config), img)
+        
     def test_auto_level(self):
         # Create low contrast image (values 100-150)
         img = QImage(2, 2, QImage.Format.Format_ARGB32_Premultiplied)
@@ -53,6 +213,25 @@ class TestPhase5(unittest.TestCase):
         self.assertLess(c1.red(), 10) # Close to 0
         self.assertGreater(c2.red(), 240) # Close to 255
         
+    def test_auto_level_per_channel(self):
+        img = QImage(2, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        img.setPixelColor(0, 0, QColor(100, 60, 0))
+        img.setPixelColor(1, 0, QColor(150, 60, 255))
+        
+        effect = AutoLevelEffect()
+        new_img = effect.apply(img, {})
+        
+        # Red is stretched, flat green is left alone, full-range blue is unchanged
+        c1, c2 = new_img.pixelColor(0, 0), new_img.pixelColor(1, 0)
+        self.assertEqual((c1.red(), c1.green(), c1.blue()), (0, 60, 0))
+        self.assertEqual((c2.red(), c2.green(), c2.blue()), (255, 60, 255))
+        
+        # Editing the image in place must not reuse stale channel ranges
+        # (a stale 100-150 red range would map 125 to 127, not 0)
+        img.setPixelColor(0, 0, QColor(125, 60, 0))
+        c = effect.apply(img, {}).pixelColor(0, 0)
+        self.assertEqual(c.red(), 0)
+        
     def test_hue_saturation(self):
         img = QImage(1, 1, QImage.Format.Format_ARGB32_Premultiplied)
         img.fill(QColor(255, 0, 0)) # Red (Hue 0, Sat 255)
@@ -66,6 +245,480 @@ class TestPhase5(unittest.TestCase):
         self.assertEqual(c.red(), 0)
         self.assertEqual(c.green(), 255)
         self.assertEqual(c.blue(), 255)
+        
+    def test_hue_saturation_all_sectors(self):
+        img = QImage(4, 1, QImage.Format.Format_ARGB32_Premultiplied)
+        img.setPixelColor(0, 0, QColor(255, 0, 0))
+        img.setPixelColor(1, 0, QColor(0, 255, 0))
+        img.setPixelColor(2, 0, QColor(0, 0, 255))
+        img.setPixelColor(3, 0, QColor(90, 90, 90))  # Gray has no hue
+        
+        effect = HueSaturationEffect()
+        
+        # +120 degrees: red -> green -> blue -> red
+        new_img = effect.apply(img, {"hue": 120, "saturation": 0})
+        expected = [(0, 255, 0), (0, 0, 255), (255, 0, 0), (90, 90, 90)]
+        for x, rgb in enumerate(expected):
+            c = new_img.pixelColor(x, 0)
+            self.assertEqual((c.red(), c.green(), c.blue()), rgb)
+        
+        # Full desaturation leaves only the value
+        new_img = effect.apply(img, {"hue": 0, "saturation": -100})
+        for x in range(4):
+            c = new_img.pixelColor(x, 0)
+            self.assertEqual(c.red(), c.green())
+            self.assertEqual(c.green(), c.blue())
+        
+    def test_hue_saturation_backends_agree_on_random_pixels(self):
+        arr = np.random.default_rng(22).integers(0, 256, (60, 70, 4), dtype=np.uint8)
+        arr[:, :, 3] = 255
+        img = numpy_to_qimage(arr)
+        
+        for config in ({"hue": 30, "saturation": 20}, {"hue": -150, "saturation": -60}):
+            fast = qimage_to_numpy(HueSaturationEffect().apply(img, config)).astype(int)
+            with mock.patch.object(adjustments, "cv2", None):
+                fallback = qimage_to_numpy(HueSaturationEffect().apply(img, config)).astype(int)
+            
+            # Both paths round: only float noise at .5 boundaries may differ,
+            # and never systematically in one direction
+            delta = fast - fallback
+            self.assertLessEqual(np.abs(delta).max(), 1, config)
+            self.assertLess(np.count_nonzero(delta), delta.size // 100, config)
+        
+    def test_hue_saturation_bands_share_one_scratch_buffer(self):
+        arr = np.random.default_rng(21).integers(0, 256, (41, 23, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        config = {"hue": 30, "saturation": 20}
+        
+        buffers = []
+        
+        def get_scratch(*args, **kwargs):
+            buffers.append(image_processing.get_scratch(*args, **kwargs))
+            return buffers[-1]
+        
+        with mock.patch.object(adjustments, "cv2", None):
+            single = qimage_to_numpy(HueSaturationEffect().apply(img, config))
+            # Four uneven bands (10, 10, 10 and 11 rows) used to evict each
+            # other's buffers from the pool on every apply
+            with mock.patch.multiple(image_processing, _ROW_WORKERS=4, _BAND_MIN_ROWS=8, _scratch={}), \
+                    mock.patch.object(adjustments, "get_scratch", get_scratch):
+                first = qimage_to_numpy(HueSaturationEffect().apply(img, config))
+                second = qimage_to_numpy(HueSaturationEffect().apply(img, config))
+        
+        self.assertEqual([b.shape for b in buffers], [(3, 41, 23)] * 2)
+        self.assertIs(buffers[1], buffers[0])
+        np.testing.assert_array_equal(first, single)
+        np.testing.assert_array_equal(second, single)
+        
+    def test_sketches_keep_source_alpha(self):
+        arr = np.zeros((6, 8, 4), dtype=np.uint8)
+        arr[:, :, 3] = 255
+        arr[:, 4:] = 200  # A vertical edge
+        arr[:3, :, 3] = 90
+        img = numpy_to_qimage(arr)
+        
+        for effect in (PencilSketchEffect(), InkSketchEffect()):
+            out = qimage_to_numpy(effect.apply(img, {}))
+            np.testing.assert_array_equal(out[:, :, 3], arr[:, :, 3])
+            # Gray output: all three colour channels agree
+            np.testing.assert_array_equal(out[:, :, 0], out[:, :, 1])
+            np.testing.assert_array_equal(out[:, :, 1], out[:, :, 2])
+        
+    def test_colour_filters_keep_source_alpha(self):
+        rng = np.random.default_rng(4)
+        arr = rng.integers(0, 256, (12, 14, 4), dtype=np.uint8)
+        arr[:, :, :3] = np.minimum(arr[:, :, :3], arr[:, :, 3:])  # Valid premultiplied
+        img = numpy_to_qimage(arr)
+        
+        cases = [(SepiaEffect(), {}), (SharpenEffect(), {"amount": 80}),
+                 (MedianEffect(), {"radius": 1}), (MedianEffect(), {"radius": 3})]
+        for effect, config in cases:
+            out = qimage_to_numpy(effect.apply(img, config))
+            np.testing.assert_array_equal(out[:, :, 3], arr[:, :, 3], err_msg=effect.name)
+        
+    def test_sharpen_matches_unsharp_formula(self):
+        arr = np.random.default_rng(6).integers(0, 256, (16, 18, 4), dtype=np.uint8)
+        arr[:, :, 3] = 255
+        img = numpy_to_qimage(arr)
+        original = arr[:, :, :3].astype(np.float64)
+        blurred = gaussian_blur_np(arr, 1.0)[:, :, :3]
+        
+        for percent in (1, 37, 100, 150):
+            out = qimage_to_numpy(SharpenEffect().apply(img, {"amount": percent}))
+            expected = np.clip(original + np.floor((original - blurred) * percent / 100), 0, 255)
+            np.testing.assert_array_equal(out[:, :, :3], expected)
+        
+    def test_zero_size_blurs_return_input(self):
+        img = QImage(4, 3, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(10, 20, 30))
+        
+        cases = [
+            (GaussianBlurEffect(), {"radius": 0}),
+            (MotionBlurEffect(), {"distance": 0, "angle": 30}),
+            (UnfocusEffect(), {"radius": 0}),
+            # A negative radius leaves the aperture without a single sample
+            (BokehBlurEffect(), {"radius": -1}),
+        ]
+        for effect, config in cases:
+            self.assertIs(effect.apply(img, config), img, effect.name)
+        
+    def test_motion_blur_smears_along_angle(self):
+        arr = np.zeros((5, 16, 4), dtype=np.uint8)
+        arr[:, :, 3] = 255
+        arr[:, 5, :3] = 200  # A bright vertical line
+        img = numpy_to_qimage(arr)
+        
+        out = qimage_to_numpy(MotionBlurEffect().apply(img, {"distance": 4, "angle": 0}))
+        
+        # Each output pixel averages itself and the 3 pixels to its left
+        np.testing.assert_array_equal(out[2, :, 0], [0] * 5 + [50] * 4 + [0] * 7)
+        np.testing.assert_array_equal(out[:, :, 3], 255)
+        
+        # Distance 0 leaves the image alone
+        np.testing.assert_array_equal(qimage_to_numpy(MotionBlurEffect().apply(img, {"distance": 0})), arr)
+        
+    def test_motion_blur_clamps_at_edges(self):
+        arr = np.zeros((4, 12, 4), dtype=np.uint8)
+        arr[:, :, 3] = 255
+        arr[:, 0, :3] = 200  # A bright column on the left edge
+        arr[0, :, :3] = 100  # And a dimmer row along the top
+        img = numpy_to_qimage(arr)
+        
+        for angle in (0, 180, 90, 270):
+            out = qimage_to_numpy(MotionBlurEffect().apply(img, {"distance": 5, "angle": angle}))
+            # Samples past the border repeat the edge pixel instead of
+            # wrapping round to the opposite side
+            expected = []
+            for y in range(4):
+                for x in range(12):
+                    steps = [(int(math.sin(math.radians(angle)) * i), int(math.cos(math.radians(angle)) * i))
+                             for i in range(5)]
+                    samples = [arr[min(max(y - sy, 0), 3), min(max(x - sx, 0), 11), 0] for sy, sx in steps]
+                    expected.append(sum(int(v) for v in samples) // 5)
+            np.testing.assert_array_equal(out[:, :, 0].ravel(), expected, err_msg=f"angle {angle}")
+        
+    def test_radial_blur_averages_rotated_samples(self):
+        arr = np.random.default_rng(6).integers(0, 256, (9, 14, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        height, width = arr.shape[:2]
+        cx, cy = width / 2, height / 2
+        
+        for amount in (1, 4):
+            out = qimage_to_numpy(RadialBlurEffect().apply(img, {"amount": amount}))
+            for y in range(height):
+                for x in range(width):
+                    total = np.zeros(4, dtype=int)
+                    for i in range(amount):
+                        angle = (i / amount) * 0.05
+                        sx = int(cx + (x - cx) * math.cos(angle) - (y - cy) * math.sin(angle))
+                        sy = int(cy + (x - cx) * math.sin(angle) + (y - cy) * math.cos(angle))
+                        total += arr[min(max(sy, 0), height - 1), min(max(sx, 0), width - 1)]
+                    np.testing.assert_array_equal(out[y, x], total // amount)
+        
+        # Two-row strips sample across their seams exactly like one strip
+        with mock.patch("src.effects.distort._SAMPLE_STRIP_BYTES", width * 4 * 2):
+            striped = qimage_to_numpy(RadialBlurEffect().apply(img, {"amount": 4}))
+        np.testing.assert_array_equal(striped, out)
+        
+    def test_zoom_blur_averages_scaled_samples(self):
+        arr = np.random.default_rng(7).integers(0, 256, (9, 14, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        height, width = arr.shape[:2]
+        cx, cy = width / 2, height / 2
+        
+        for amount in (5, 60):
+            out = qimage_to_numpy(ZoomBlurEffect().apply(img, {"amount": amount}))
+            samples = max(2, amount // 5)
+            for y in range(height):
+                for x in range(width):
+                    total = np.zeros(4, dtype=int)
+                    for i in range(samples):
+                        # The effect maps coordinates in float32
+                        scale = np.float32(1.0 - (i / samples) * (amount / 100.0))
+                        sx = min(max(int(np.float32(cx) + np.float32(x - cx) * scale), 0), width - 1)
+                        sy = min(max(int(np.float32(cy) + np.float32(y - cy) * scale), 0), height - 1)
+                        total += arr[sy, sx]
+                    np.testing.assert_array_equal(out[y, x], total // samples)
+        
+        with mock.patch("src.effects.distort._SAMPLE_STRIP_BYTES", width * 4 * 2):
+            striped = qimage_to_numpy(ZoomBlurEffect().apply(img, {"amount": 60}))
+        np.testing.assert_array_equal(striped, out)
+        
+    def test_bulge_moves_only_inside_circle(self):
+        arr = np.random.default_rng(8).integers(0, 256, (20, 30, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        yy, xx = np.mgrid[0:20, 0:30]
+        outside = np.hypot(xx - 15, yy - 10) >= 10
+        
+        np.testing.assert_array_equal(qimage_to_numpy(BulgeEffect().apply(img, {"amount": 0})), arr)
+        for amount in (50, -60):
+            out = qimage_to_numpy(BulgeEffect().apply(img, {"amount": amount}))
+            np.testing.assert_array_equal(out[outside], arr[outside])
+            np.testing.assert_array_equal(out[10, 15], arr[10, 15])
+            self.assertFalse(np.array_equal(out, arr))
+            
+            # Bilinear sampling moves the same pixels, just smoothly
+            smooth = qimage_to_numpy(BulgeEffect().apply(img, {"amount": amount, "quality": "high"}))
+            np.testing.assert_array_equal(smooth[outside], arr[outside])
+            self.assertFalse(np.array_equal(smooth, out))
+        
+    def test_twist_moves_only_inside_circle(self):
+        arr = np.random.default_rng(9).integers(0, 256, (20, 30, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        yy, xx = np.mgrid[0:20, 0:30]
+        outside = np.hypot(xx - 15, yy - 10) >= 10
+        
+        np.testing.assert_array_equal(qimage_to_numpy(TwistEffect().apply(img, {"angle": 0})), arr)
+        out = qimage_to_numpy(TwistEffect().apply(img, {"angle": 90}))
+        np.testing.assert_array_equal(out[outside], arr[outside])
+        self.assertFalse(np.array_equal(out, arr))
+        
+    def test_dents_matches_full_grid_mapping(self):
+        arr = np.random.default_rng(10).integers(0, 256, (25, 33, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        y_coords, x_coords = np.mgrid[0:25, 0:33].astype(np.float32)
+        
+        for amount, scale in ((10, 20), (4, 7)):
+            out = qimage_to_numpy(DentsEffect().apply(img, {"amount": amount, "scale": scale}))
+            dx = (amount * np.sin(y_coords / scale * 2 * np.pi)).astype(np.int32)
+            dy = (amount * np.sin(x_coords / scale * 2 * np.pi)).astype(np.int32)
+            sx = np.clip(x_coords.astype(np.int32) + dx, 0, 32)
+            sy = np.clip(y_coords.astype(np.int32) + dy, 0, 24)
+            np.testing.assert_array_equal(out, arr[sy, sx])
+        
+    def test_rotate_3d_matches_projected_grid(self):
+        arr = np.random.default_rng(11).integers(0, 256, (21, 30, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        y_coords, x_coords = np.mgrid[0:21, 0:30].astype(np.float32)
+        focal = 60
+        
+        for rx, ry, zoom in ((0, 0, 100), (20, -15, 120), (-60, 60, 50)):
+            out = qimage_to_numpy(Rotate3DEffect().apply(
+                img, {"rotate_x": rx, "rotate_y": ry, "zoom": zoom}))
+            ax, ay = math.radians(rx), math.radians(ry)
+            nx, ny = (x_coords - 15) / (zoom / 100), (y_coords - 10.5) / (zoom / 100)
+            y1, z1 = ny * np.cos(ax), ny * np.sin(ax)
+            x2 = nx * np.cos(ay) + z1 * np.sin(ay)
+            z2 = -nx * np.sin(ay) + z1 * np.cos(ay)
+            scale = focal / (focal + z2)
+            sx = (x2 * scale + 15).astype(np.int32)
+            sy = (y1 * scale + 10.5).astype(np.int32)
+            inside = (sx >= 0) & (sx < 30) & (sy >= 0) & (sy < 21)
+            
+            expected = np.zeros_like(arr)
+            expected[inside] = arr[sy[inside], sx[inside]]
+            np.testing.assert_array_equal(out, expected, err_msg=f"{rx}, {ry}, {zoom}")
+        np.testing.assert_array_equal(
+            qimage_to_numpy(Rotate3DEffect().apply(img, {})), arr)
+        
+    def test_rotate_3d_smooth_is_bilinear_projection(self):
+        # A smooth opaque gradient, so bilinear sampling has something to blend
+        yy, xx = np.mgrid[0:60, 0:80]
+        arr = np.zeros((60, 80, 4), dtype=np.uint8)
+        arr[:, :, 0] = xx * 3
+        arr[:, :, 1] = yy * 4
+        arr[:, :, 3] = 255
+        img = numpy_to_qimage(arr)
+        
+        for rx, ry, zoom in ((20, -15, 120), (-40, 30, 60)):
+            out = qimage_to_numpy(Rotate3DEffect().apply(
+                img, {"rotate_x": rx, "rotate_y": ry, "zoom": zoom, "quality": "high"}))
+            ax, ay = math.radians(rx), math.radians(ry)
+            nx, ny = (xx - 40) / (zoom / 100), (yy - 30) / (zoom / 100)
+            z1 = ny * math.sin(ax)
+            x2 = nx * math.cos(ay) + z1 * math.sin(ay)
+            scale = 160 / (160 - nx * math.sin(ay) + z1 * math.cos(ay))
+            map_x, map_y = x2 * scale + 40, ny * math.cos(ax) * scale + 30
+            
+            # Qt's fixed-point weights land within a couple of levels of the
+            # float blend away from the image's edges...
+            inside = (map_x >= 1) & (map_x <= 78) & (map_y >= 1) & (map_y <= 58)
+            expected = remap_bilinear(arr, map_x, map_y)
+            self.assertLessEqual(np.abs(out[inside].astype(int) - expected[inside]).max(), 2)
+            # ...and everything projected off the source stays transparent
+            outside = (map_x < -1) | (map_x > 80) | (map_y < -1) | (map_y > 60)
+            self.assertTrue(outside.any() or zoom > 100)
+            np.testing.assert_array_equal(out[outside], 0)
+        
+    def test_polar_inversion_matches_per_pixel_mapping(self):
+        arr = np.random.default_rng(12).integers(0, 256, (13, 18, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        height, width = arr.shape[:2]
+        cx, cy = width / 2, height / 2
+        max_radius = math.hypot(cx, cy)
+        
+        to_polar = qimage_to_numpy(PolarInversionEffect().apply(img, {"amount": 100}))
+        from_polar = qimage_to_numpy(PolarInversionEffect().apply(img, {"amount": -100}))
+        for y in range(height):
+            for x in range(width):
+                theta = math.atan2(y - cy, x - cx)
+                sx = int((theta + math.pi) / (2 * math.pi) * width)
+                sy = int(math.hypot(x - cx, y - cy) / max_radius * height)
+                np.testing.assert_array_equal(
+                    to_polar[y, x], arr[min(sy, height - 1), min(sx, width - 1)])
+                
+                angle = x / width * 2 * math.pi - math.pi
+                r = y / height * max_radius
+                sx = min(max(int(cx + r * math.cos(angle)), 0), width - 1)
+                sy = min(max(int(cy + r * math.sin(angle)), 0), height - 1)
+                np.testing.assert_array_equal(from_polar[y, x], arr[sy, sx])
+        
+    def test_frosted_glass_scatters_within_amount(self):
+        # Each pixel encodes its own coordinates, so the output reveals
+        # where every sample was taken from
+        yy, xx = np.mgrid[0:30, 0:40]
+        arr = np.zeros((30, 40, 4), dtype=np.uint8)
+        arr[:, :, 0] = xx
+        arr[:, :, 1] = yy
+        arr[:, :, 3] = 255
+        img = numpy_to_qimage(arr)
+        
+        out = qimage_to_numpy(FrostedGlassEffect().apply(img, {"amount": 3}))
+        
+        self.assertLessEqual(np.abs(out[:, :, 0].astype(int) - xx).max(), 3)
+        self.assertLessEqual(np.abs(out[:, :, 1].astype(int) - yy).max(), 3)
+        self.assertFalse(np.array_equal(out, arr))
+        # Seeded, so repeated runs agree
+        np.testing.assert_array_equal(qimage_to_numpy(FrostedGlassEffect().apply(img, {"amount": 3})), out)
+        
+    def test_drop_shadow_offsets_scaled_alpha(self):
+        arr = np.zeros((10, 12, 4), dtype=np.uint8)
+        arr[2:5, 3:7] = 255  # Opaque white block on a transparent layer
+        img = numpy_to_qimage(arr)
+        
+        out = qimage_to_numpy(DropShadowEffect().apply(
+            img, {"offset_x": 2, "offset_y": 3, "blur": 0, "opacity": 50}))
+        
+        # The layer stays on top, unchanged
+        np.testing.assert_array_equal(out[2:5, 3:7], arr[2:5, 3:7])
+        # Black shadow at half the layer's alpha, shifted by the offset
+        np.testing.assert_array_equal(out[5:8, 5:9, 3], 127)
+        np.testing.assert_array_equal(out[5:8, 5:9, :3], 0)
+        self.assertEqual(int(out[:, :, 3].astype(bool).sum()), 12 + 12)
+        
+    def test_pixelate_matches_cell_means(self):
+        arr = np.random.default_rng(7).integers(0, 256, (11, 17, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        
+        for cell in (2, 4, 5, 20):  # Ragged last cells, and one cell larger than the image
+            out = qimage_to_numpy(PixelateEffect().apply(img, {"cell_size": cell}))
+            expected = np.empty_like(arr)
+            for cy in range(0, 11, cell):
+                for cx in range(0, 17, cell):
+                    block = arr[cy:cy + cell, cx:cx + cell]
+                    expected[cy:cy + cell, cx:cx + cell] = block.mean(axis=(0, 1)).astype(np.uint8)
+            np.testing.assert_array_equal(out, expected, err_msg=f"cell {cell}")
+        # The cells are written into a fresh image, never the source
+        np.testing.assert_array_equal(qimage_to_numpy(img), arr)
+        
+    def test_pixelate_single_pixel_cells_return_input(self):
+        img = QImage(4, 3, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(10, 20, 30))
+        
+        for cell in (0, 1):
+            self.assertIs(PixelateEffect().apply(img, {"cell_size": cell}), img, cell)
+        
+    def test_emboss_matches_correlation(self):
+        from scipy.ndimage import correlate
+        
+        arr = np.random.default_rng(8).integers(0, 256, (9, 13, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        kernel = np.array([[-2, -1, 0], [-1, 1, 1], [0, 1, 2]])
+        
+        for backend in (distort.cv2, None):
+            with mock.patch.object(distort, "cv2", backend):
+                out = qimage_to_numpy(EmbossEffect().apply(img, {}))
+            
+            for c in range(3):
+                expected = correlate(arr[:, :, c].astype(int), kernel, mode='nearest') + 128
+                np.testing.assert_array_equal(out[:, :, c], np.clip(expected, 0, 255),
+                                              err_msg=f"cv2 {backend is not None}")
+            np.testing.assert_array_equal(out[:, :, 3], arr[:, :, 3])
+        
+    def test_edge_detect_is_sobel_magnitude(self):
+        from scipy.ndimage import sobel
+        
+        arr = np.zeros((12, 14, 4), dtype=np.uint8)
+        arr[:, :, 3] = 200
+        arr[:, 7:, :3] = 150  # A vertical edge
+        arr[3, 3, :3] = 90
+        arr[8, 2, :3] = (20, 160, 90)  # A coloured spot, weighted as luma
+        img = numpy_to_qimage(arr)
+        
+        out = qimage_to_numpy(EdgeDetectEffect().apply(img, {}))
+        
+        b, g, r = (arr[:, :, c].astype(int) for c in range(3))
+        gray = ((77 * r + 150 * g + 29 * b) >> 8).astype(np.float64)
+        expected = np.clip(np.hypot(sobel(gray, axis=1), sobel(gray, axis=0)), 0, 255)
+        for c in range(3):
+            np.testing.assert_allclose(out[:, :, c], expected, atol=1)
+        np.testing.assert_array_equal(out[:, :, 3], 200)
+        
+    def test_median_matches_brute_force(self):
+        rng = np.random.default_rng(3)
+        arr = rng.integers(0, 256, (9, 11, 4), dtype=np.uint8)
+        arr[:, :, 3] = 255
+        img = numpy_to_qimage(arr)
+        
+        # Radius 1 takes the selection-network path, radius 2 the generic one
+        for radius in (1, 2):
+            out = qimage_to_numpy(MedianEffect().apply(img, {"radius": radius}))
+            padded = np.pad(arr, ((radius, radius), (radius, radius), (0, 0)), mode='edge')
+            for y in range(arr.shape[0]):
+                for x in range(arr.shape[1]):
+                    window = padded[y:y + 2 * radius + 1, x:x + 2 * radius + 1, :3]
+                    expected = np.median(window.reshape(-1, 3), axis=0)
+                    np.testing.assert_array_equal(out[y, x, :3], expected)
+            np.testing.assert_array_equal(out[:, :, 3], 255)
+        
+    def test_add_noise_stays_within_intensity(self):
+        arr = np.full((40, 50, 4), 128, dtype=np.uint8)
+        arr[:, :, 3] = np.arange(50, dtype=np.uint8) + 200
+        img = numpy_to_qimage(arr)
+        
+        out = qimage_to_numpy(AddNoiseEffect().apply(img, {"intensity": 20}))
+        
+        delta = out[:, :, :3].astype(int) - 128
+        self.assertLessEqual(np.abs(delta).max(), 20)
+        self.assertGreater(delta.std(), 5)  # Actually noisy
+        np.testing.assert_array_equal(out[:, :, 3], arr[:, :, 3])
+        
+        # Strips draw from separate streams rather than repeating one pattern
+        with mock.patch("src.effects.distort._NOISE_STRIP_BYTES", 50 * 3 * 2 * 4):
+            out = qimage_to_numpy(AddNoiseEffect().apply(img, {"intensity": 20}))
+        strips = out[:, :, :3].reshape(10, 4, 50, 3)
+        self.assertFalse(any(np.array_equal(strips[0], strips[i]) for i in range(1, 10)))
+        
+    def test_add_noise_without_intensity_returns_input(self):
+        img = QImage(4, 3, QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(QColor(10, 20, 30))
+        
+        for intensity in (0, -5):
+            self.assertIs(AddNoiseEffect().apply(img, {"intensity": intensity}), img, intensity)
+        
+    def test_reduce_noise_is_3x3_median(self):
+        arr = np.random.default_rng(4).integers(0, 256, (12, 10, 4), dtype=np.uint8)
+        img = numpy_to_qimage(arr)
+        
+        out = qimage_to_numpy(ReduceNoiseEffect().apply(img, {}))
+        
+        median = qimage_to_numpy(MedianEffect().apply(img, {"radius": 1}))
+        np.testing.assert_array_equal(out, median)
+        np.testing.assert_array_equal(out[:, :, 3], arr[:, :, 3])
+        
+    def test_crystallize_nearest_seed(self):
+        # The grid lookup must agree with a brute-force nearest-seed search
+        rng = np.random.default_rng(1)
+        for height, width, cell in [(23, 31, 4), (9, 40, 7), (3, 3, 5)]:
+            rows, cols = -(-height // cell), -(-width // cell)
+            seed_x = np.minimum(np.arange(cols) * cell + rng.integers(0, cell, (rows, cols)), width - 1)
+            seed_y = np.minimum(np.arange(rows)[:, None] * cell + rng.integers(0, cell, (rows, cols)), height - 1)
+            
+            indices = CrystallizeEffect._nearest_seed(seed_x, seed_y, cell)[:height, :width]
+            
+            yy, xx = np.mgrid[0:height, 0:width]
+            dist = (xx[..., None] - seed_x.ravel()) ** 2 + (yy[..., None] - seed_y.ravel()) ** 2
+            np.testing.assert_array_equal(indices, dist.argmin(axis=-1))
 
 if __name__ == '__main__':
     unittest.main()